@@ -1,112 +1,242 @@
 import os
+import random
+import threading
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 from zoneinfo import ZoneInfo
+from dashboard_data import (CONTRACTOR_FILE, PUBLISHED_CSV, PROJECT_COLS, SPRINT_REPORT_COLS, read_task_export,
+                            read_contractor_file, process_task_levels, summarize_contractors, build_sprint_dimension,
+                            sprint_name, sum_by_sprint, hour_totals,
+                            sprint_metrics, sprint_status_breakdown, sprint_contractor_breakdown, sprint_task_list,
+                            project_hours_summary, contractor_performance, backlog_tasks)
+from report_export import export_csv, export_sprint_pack
+from render_profiler import RenderProfiler, profiling_enabled
+from arrow_handoff import current_path
+from data_watcher import DatasetWatcher
+from run_metrics import RunMetrics
+
+# plotly is imported by load_plotly() when the first figure is built, not on every cold start
+px = go = None
 
 st.set_page_config(page_title="Version One Hours Tracker", layout="wide", page_icon="📊")
 
-CONTRACTOR_FILE = "Contractor File.xlsx"
-PROJECT_COLS = ['CDAS - 6441', 'EDS-4834', 'EEB-9372', 'UAP-SPM-9442', 'UAP-IV-9443', 'UAPSAL-9402']
+# Per-section render timings, shown in the sidebar with ?profile=1 (no-op otherwise)
+profiler = RenderProfiler(profiling_enabled())
+
+FIGURE_CACHE_ENTRIES = 256
+MAX_SPRINT_BUCKETS = 40
+TABLE_PAGE_SIZES = [100, 250, 500, 1000]
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+ALL_SPRINTS = 'All Sprints'
+# Open sessions check the shared dataset's version this often, each with its own random offset so a
+# refresh does not make every tab rerun at the same moment
+SESSION_POLL_SECONDS = 15
+SESSION_POLL_JITTER_SECONDS = 10
+# A cold start paints the page without waiting for the watcher's first load: the first run waits this
+# long for it, then the session polls every WARMUP_POLL_SECONDS and shows the data once it is ready
+FIRST_PAINT_WAIT_SECONDS = 0.5
+WARMUP_POLL_SECONDS = 1
+
+@st.cache_resource
+def cold_start_metrics():
+    # Created by the first script run in this server process; milestones are seconds from here. Written
+    # once to logs/run_metrics.jsonl - `python run_metrics.py summary --name dashboard_cold_start`.
+    # Sessions run on their own threads, so the lock guards the check-then-record in mark_cold_start
+    return RunMetrics("dashboard_cold_start"), threading.Lock()
+
+def mark_cold_start(step, at=None, **tags):
+    run, lock = cold_start_metrics()
+    with lock:
+        if any(s["step"] in (step, "full_render") for s in run.spans):
+            return
+        run.record(step, at, **tags)
+        if step == "full_render":
+            run.finish()
+
+def load_plotly():
+    global px, go
+    if px is None:
+        import plotly.express as px
+        import plotly.graph_objects as go
+        mark_cold_start("plotly_loaded")
 
 @st.cache_data(ttl=10)
 def load_contractor_data():
-    df = pd.read_excel(CONTRACTOR_FILE)
-    # Map old column names to new ones if needed
-    rename_map = {'CDAS-6441': 'CDAS - 6441'}
-    df = df.rename(columns=rename_map)
-    df = df[['Contractor Group', 'Names'] + PROJECT_COLS].copy()
-    df.columns = ['Contractor Group', 'Owner'] + PROJECT_COLS
-    df['Owner'] = df['Owner'].astype(str).str.strip()
-    return df
+    return read_contractor_file(CONTRACTOR_FILE)
 
 def process_uploaded_file(uploaded_df):
-    contractor_df = load_contractor_data()
-
-    uploaded_df['Owner'] = uploaded_df['Owner'].astype(str).str.strip()
-    uploaded_df['Status'] = uploaded_df['Status'].astype(str).fillna('Unknown')
-    uploaded_df['Sprint'] = uploaded_df['Sprint'].astype(str).str.extract(r'(\d+)').astype(float)
-    uploaded_df['Backlog'] = uploaded_df['Backlog'].astype(str).fillna('')
-    uploaded_df['Est. Hours'] = pd.to_numeric(uploaded_df['Est. Hours'], errors='coerce').fillna(0)
-    uploaded_df['To Do'] = pd.to_numeric(uploaded_df['To Do'], errors='coerce').fillna(0)
-
-    uploaded_df = uploaded_df.merge(contractor_df[['Owner', 'Contractor Group']], on='Owner', how='left')
-    uploaded_df['Contractor Group'] = uploaded_df['Contractor Group'].fillna('Unknown')
-
-    # Calculate Completed Hours FIRST
-    uploaded_df['Completed Hours'] = uploaded_df['Est. Hours'] - uploaded_df['To Do']
-
-    # Now populate project columns - preserve existing values or derive from Planning Level
-    for col in PROJECT_COLS:
-        if col in uploaded_df.columns:
-            # Preserve existing project hours, but fill missing with Planning Level logic
-            uploaded_df[col] = pd.to_numeric(uploaded_df[col], errors='coerce')
-            mask = uploaded_df[col].isna() | (uploaded_df[col] == 0)
-            uploaded_df.loc[mask & (uploaded_df.get('Planning Level') == col), col] = uploaded_df.loc[mask & (uploaded_df.get('Planning Level') == col), 'Completed Hours']
-            uploaded_df[col] = uploaded_df[col].fillna(0)
-        else:
-            # Column doesn't exist - derive from Planning Level
-            uploaded_df[col] = uploaded_df.apply(
-                lambda row: row["Completed Hours"] if row.get("Planning Level") == col else 0.0,
-                axis=1
-            )
-
-    uploaded_df['Progress %'] = ((uploaded_df['Completed Hours'] / uploaded_df['Est. Hours']) * 100).fillna(0).round(1)
-    uploaded_df['Total Project Hours'] = uploaded_df[PROJECT_COLS].sum(axis=1)
+    return process_task_levels(uploaded_df, load_contractor_data())
 
-    return uploaded_df
-    
-    st.write("Raw columns:", uploaded_df.columns.tolist())
-    st.write("Sample project values:", uploaded_df[PROJECT_COLS].head())
+def get_all_contractors_with_hours(df):
+    return summarize_contractors(df, load_contractor_data())
+
+def get_data_version(path):
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+def resolve_data_source():
+    # Prefer the scraper's Arrow handoff (same machine, no parse step), then the published CSV; the xlsx is
+    # kept as a fallback for checkouts that predate both
+    handoff_file, handoff = current_path()
+    contractor_version = get_data_version(CONTRACTOR_FILE)
+    if handoff_file:
+        # A new handoff is picked up by its version counter rather than by stat-ing the data file
+        return (handoff_file, f"arrow-v{handoff['version']}|{contractor_version}",
+                datetime.fromisoformat(handoff['written_at']))
+    data_file = PUBLISHED_CSV if os.path.exists(PUBLISHED_CSV) else "task_quicklist.xlsx"
+    if not os.path.exists(data_file):
+        return None, None, None
+    return (data_file, f"{get_data_version(data_file)}|{contractor_version}",
+            datetime.fromtimestamp(os.path.getmtime(data_file)))
+
+def load_local_data(path):
+    # Runs on the watcher thread, so it must not call st.cache_data functions. It is outside every rerun's
+    # profiler, so it keeps its own section timings; the profiling panel shows them with the snapshot
+    timer = RenderProfiler(True)
+    with timer.section("data load: read export"):
+        raw_df = read_task_export(path)
+    with timer.section("data load: process tasks"):
+        tasks, levels = process_task_levels(raw_df, read_contractor_file(CONTRACTOR_FILE))
+    with timer.section("data load: sprint dimension"):
+        sprint_dim = build_sprint_dimension(tasks)
+    return tasks, sprint_dim, levels, timer.sections
+
+@st.cache_resource
+def get_data_watcher():
+    # One watcher per server process; its snapshot frames are shared by every session and must not be mutated.
+    # Returns at once: the first load runs on the watcher's thread
+    return DatasetWatcher(resolve_data_source, load_local_data)
+
+@st.cache_data(max_entries=2, show_spinner="Loading VersionOne data...")
+def load_dashboard_data(version, _source):
+    # Parsing, processing and the sprint dimension happen once per data version
+    with profiler.section("data load: read export"):
+        raw_df = read_task_export(_source)
+    with profiler.section("data load: process tasks"):
+        tasks, levels = process_uploaded_file(raw_df)
+    with profiler.section("data load: sprint dimension"):
+        return tasks, build_sprint_dimension(tasks), levels
+
+def sprint_options(all_option=None, reverse=True):
+    keys = sprint_dim.index.tolist()
+    if reverse:
+        keys.reverse()
+    return ([all_option] if all_option else []) + keys
+
+def format_sprint(option):
+    return option if isinstance(option, str) else sprint_name(option)
+
+def filter_sprint(frame, sprint_key):
+    return frame if sprint_key == ALL_SPRINTS else frame[frame['Sprint Key'] == sprint_key]
+
+def in_planning_levels(frame, levels):
+    # Row mask for frame (df or a filtered view of it): tasks under any of `levels`, including tasks stored
+    # once for several levels. level_dim is the membership table loaded with df
+    return level_dim.reindex(index=frame.index, columns=levels, fill_value=False).any(axis=1)
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def _build_cached_figure(chart_id, version, filters, _build):
+    load_plotly()
+    return _build()
+
+def cached_figure(chart_id, filters, build):
+    # Figures are shared between reruns and sessions - callers must not mutate them
+    with profiler.section(f"figure build: {chart_id}"):
+        return _build_cached_figure(chart_id, data_version, tuple(filters), build)
+
+def show_chart(fig, chart_id):
+    # Timed apart from the build: serializing a large figure to the browser can cost more than building it
+    with profiler.section(f"chart serialization: {chart_id}"):
+        st.plotly_chart(fig, use_container_width=True)
+
+def bucket_sprints(summary, value_cols, max_buckets=MAX_SPRINT_BUCKETS):
+    # Merge adjacent sprints so long histories stay at max_buckets bars; totals are preserved
+    summary = summary.sort_values('Sprint').reset_index(drop=True)
+    if len(summary) <= max_buckets:
+        return summary
+    bucket_size = -(-len(summary) // max_buckets)
+    grouped = summary.groupby(summary.index // bucket_size)
+    bucketed = grouped[value_cols].sum().reset_index(drop=True)
+    first, last = grouped['Sprint'].min(), grouped['Sprint'].max()
+    bucketed.insert(0, 'Sprint', [f"{a:g}" if a == b else f"{a:g}-{b:g}" for a, b in zip(first, last)])
+    return bucketed
+
+def paginated_dataframe(frame, key, height=400):
+    # Sort and slice on the server so only the visible page is sent to the browser
+    ctrl_sort, ctrl_order, ctrl_size, ctrl_page = st.columns([3, 2, 2, 2])
+    sort_col = ctrl_sort.selectbox("Sort by", ["(default order)"] + frame.columns.tolist(), key=f"{key}_sort")
+    descending = ctrl_order.radio("Order", ["Ascending", "Descending"], horizontal=True, key=f"{key}_order") == "Descending"
+    page_size = ctrl_size.selectbox("Rows per page", TABLE_PAGE_SIZES, key=f"{key}_page_size")
+
+    page_count = max(1, -(-len(frame) // page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > page_count:
+        st.session_state[page_key] = page_count
+    page = ctrl_page.number_input(f"Page (of {page_count:,})", min_value=1, max_value=page_count, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    stop = min(start + page_size, len(frame))
+    if sort_col == "(default order)":
+        page_df = frame.iloc[start:stop]
+    else:
+        values = frame[sort_col].reset_index(drop=True)
+        try:
+            order = values.sort_values(ascending=not descending, kind='stable', na_position='last').index
+        except TypeError:
+            # Mixed-type object columns - fall back to comparing them as text
+            order = values.astype(str).sort_values(ascending=not descending, kind='stable').index
+        page_df = frame.iloc[order[start:stop]]
 
+    with profiler.section(f"table: {key}"):
+        st.dataframe(page_df, use_container_width=True, height=height)
+    st.caption(f"Showing rows {start + 1 if len(frame) else 0:,}-{stop:,} of {len(frame):,}")
 
-def get_all_contractors_with_hours(df):
-    contractor_df = load_contractor_data()
-    hours_by_owner = df.groupby('Owner').agg({
-        'Est. Hours': 'sum',
-        'Completed Hours': 'sum',
-        'To Do': 'sum',
-        'Title': 'count'
-    }).reset_index()
-    hours_by_owner.columns = ['Owner', 'Est. Hours', 'Completed Hours', 'To Do', 'Task Count']
-
-    all_contractors = contractor_df[['Owner', 'Contractor Group']].copy()
-    all_contractors = all_contractors.merge(hours_by_owner, on='Owner', how='left')
-    all_contractors = all_contractors.fillna(0)
-
-    # Round hour columns to 1 decimal place and Task Count to integer
-    all_contractors['Est. Hours'] = all_contractors['Est. Hours'].round(1)
-    all_contractors['Completed Hours'] = all_contractors['Completed Hours'].round(1)
-    all_contractors['To Do'] = all_contractors['To Do'].round(1)
-    all_contractors['Task Count'] = all_contractors['Task Count'].astype(int)
-
-    return all_contractors
-    
 # --- Streamlit UI ---
+cold_start_metrics()
 st.title("📊 Version One Hours Tracker")
 st.markdown("### Data Engineering Team - Sprint Hour Management")
 
-DATA_FILE = "task_quicklist.xlsx"
 df = None
+sprint_dim = None
+level_dim = None
+data_version = None
+scraped_at = None
+watcher = None
+warming = False
 
 # Load from local file if available
-if os.path.exists(DATA_FILE):
-    try:
-        raw_df = pd.read_excel(DATA_FILE, engine="openpyxl")
-        df = process_uploaded_file(raw_df)
-    except Exception as e:
-        st.error(f"Error loading data file: {str(e)}")
-else:
+try:
+    with profiler.section("data load"):
+        watcher = get_data_watcher()
+        # A load already warmed by an earlier session is used straight away; otherwise paint now and poll
+        warming = not watcher.ready.wait(FIRST_PAINT_WAIT_SECONDS)
+except Exception as e:
+    st.error(f"Error loading data file: {str(e)}")
+
+snapshot = watcher.snapshot if watcher else None
+if snapshot:
+    df, sprint_dim, level_dim = snapshot.tasks, snapshot.sprint_dim, snapshot.levels
+    data_version, scraped_at = snapshot.version, snapshot.scraped_at
+    mark_cold_start("data_ready", watcher.ready_at, source=os.path.basename(snapshot.source))
+    if watcher.error:
+        st.warning(f"Showing the previous data - the latest refresh could not be loaded: {watcher.error}")
+elif warming:
+    st.info("⏳ Loading VersionOne data - the dashboard will appear here as soon as it is ready.")
+elif watcher and watcher.error:
+    st.error(f"Error loading data file: {watcher.error}")
+elif watcher:
     st.warning("No VersionOne export file found. Please upload one manually below.")
     uploaded_file = st.file_uploader("📤 Upload Version One Export File", type=["xlsx"])
     if uploaded_file:
         try:
-            raw_df = pd.read_excel(uploaded_file, engine="openpyxl")
-            df = process_uploaded_file(raw_df)
+            data_version = f"upload-{uploaded_file.file_id}|{get_data_version(CONTRACTOR_FILE)}"
+            with profiler.section("data load"):
+                df, sprint_dim, level_dim = load_dashboard_data(data_version, uploaded_file)
         except Exception as e:
             st.error(f"Error loading uploaded file: {str(e)}")
+# The title and the loading notice (or the first data) are on screen at this point
+mark_cold_start("first_paint")
 
 
 # Define tabs if data is loaded
@@ -121,18 +251,21 @@ if df is not None:
         "📂 Backlog Tasks"
     ])
 
-    with tab1:
+    with tab1, profiler.section("tab: Dashboard"):
         st.header("📈 Overview Dashboard")
 
         if df is not None:
             # Debug info - show what's actually loaded
-            unique_sprints = sorted(df['Sprint'].dropna().unique())
+            unique_sprints = sprint_dim.index.tolist()
             st.info(f"📊 Loaded data contains {len(df)} tasks across {len(unique_sprints)} sprints: {unique_sprints}")
 
-            # Summary metrics
-            total_est = df['Est. Hours'].sum()
-            total_completed = df['Completed Hours'].sum()
-            total_remaining = df['To Do'].sum()
+            # Summary metrics - tasks under several planning levels are stored once, but can be counted per level
+            count_mode = st.radio("Count tasks under several planning levels", ["Once", "Once per planning level"],
+                                  horizontal=True)
+            totals = hour_totals(df, ['Est. Hours', 'Completed Hours', 'To Do'], per_level=count_mode != "Once")
+            total_est = totals['Est. Hours']
+            total_completed = totals['Completed Hours']
+            total_remaining = totals['To Do']
             overall_progress = (total_completed / total_est * 100) if total_est > 0 else 0
 
             col1, col2, col3, col4 = st.columns(4)
@@ -140,19 +273,18 @@ if df is not None:
             col2.metric("Completed Hours", f"{total_completed:,.1f}")
             col3.metric("Remaining Hours", f"{total_remaining:,.1f}")
             col4.metric("Overall Progress", f"{overall_progress:.1f}%")
+            mark_cold_start("summary_metrics")
 
             st.markdown("---")
             
             # ✅ Insert here
             st.subheader("🔍 Completed Hours Validation")
 
-            # Normalize Sprint and Status columns
-            df["Sprint"] = pd.to_numeric(df["Sprint"], errors="coerce")
-            df["Status"] = df["Status"].astype(str).str.strip().str.lower()
+            # Normalize Status column (rebinds df: the loaded frame is shared between sessions)
+            df = df.assign(Status=df["Status"].astype(str).str.strip().str.lower())
 
             # Get available sprints
-            available_sprints = sorted(df["Sprint"].dropna().unique(), reverse=True)
-            selected_sprint = st.selectbox("Select Sprint", available_sprints)
+            selected_sprint = st.selectbox("Select Sprint", sprint_options(), format_func=format_sprint)
 
             # View mode toggle
             view_mode = st.radio("View Mode", ["Current Sprint", "All Sprints"])
@@ -163,14 +295,14 @@ if df is not None:
 
             # ✅ Apply sprint filter
             if view_mode == "Current Sprint":
-                filtered_df = filtered_df[filtered_df["Sprint"] == selected_sprint]
+                filtered_df = filter_sprint(filtered_df, selected_sprint)
 
             # ✅ Add Planning Level filter
-            planning_levels = sorted(df["Planning Level"].dropna().unique())
+            planning_levels = level_dim.columns.tolist()
             selected_pl = st.selectbox("Filter by Planning Level", ["All"] + planning_levels)
 
             if selected_pl != "All":
-                filtered_df = filtered_df[filtered_df["Planning Level"] == selected_pl]
+                filtered_df = filtered_df[in_planning_levels(filtered_df, [selected_pl])]
 
             # ✅ Display total completed hours using math
             total_completed = filtered_df["Completed Hours"].sum()
@@ -184,28 +316,34 @@ if df is not None:
             if filtered_df.empty:
                 st.warning("No tasks found for the selected sprint and planning level.")
             else:
-                st.dataframe(filtered_df[available_cols].head(50))            
+                with profiler.section("table: task_preview"):
+                    st.dataframe(filtered_df[available_cols].head(50))
 
             # Sprint chart
             st.subheader("Hours by Sprint")
-            sprint_summary = df.groupby('Sprint')[['Completed Hours', 'To Do']].sum().reset_index()
-            fig_sprint = px.bar(sprint_summary, x='Sprint', y=['Completed Hours', 'To Do'], barmode='stack',
-                                color_discrete_map={'Completed Hours': '#00CC96', 'To Do': '#EF553B'})
-            st.plotly_chart(fig_sprint, use_container_width=True)
+            def build_sprint_chart():
+                sprint_summary = sum_by_sprint(df, ['Completed Hours', 'To Do'], sprint_dim)
+                sprint_summary = bucket_sprints(sprint_summary, ['Completed Hours', 'To Do'])
+                return px.bar(sprint_summary, x='Sprint', y=['Completed Hours', 'To Do'], barmode='stack',
+                              color_discrete_map={'Completed Hours': '#00CC96', 'To Do': '#EF553B'})
+            fig_sprint = cached_figure("dashboard_sprint_hours", (), build_sprint_chart)
+            show_chart(fig_sprint, "dashboard_sprint_hours")
 
             # Contractor chart
             st.subheader("Hours by Contractor Group")
-            contractor_summary = df.groupby('Contractor Group')[['Completed Hours', 'To Do']].sum().reset_index()
-            fig_contractor = px.bar(contractor_summary, x='Contractor Group', y=['Completed Hours', 'To Do'], barmode='stack',
-                                    color_discrete_map={'Completed Hours': '#00CC96', 'To Do': '#EF553B'})
-            st.plotly_chart(fig_contractor, use_container_width=True)
+            def build_contractor_chart():
+                contractor_summary = df.groupby('Contractor Group')[['Completed Hours', 'To Do']].sum().reset_index()
+                return px.bar(contractor_summary, x='Contractor Group', y=['Completed Hours', 'To Do'], barmode='stack',
+                              color_discrete_map={'Completed Hours': '#00CC96', 'To Do': '#EF553B'})
+            fig_contractor = cached_figure("dashboard_contractor_hours", (), build_contractor_chart)
+            show_chart(fig_contractor, "dashboard_contractor_hours")
 
             st.markdown("---")
             st.subheader("Task Progress Details")
 
             # Filters
             col1, col2, col3, col4, col5 = st.columns(5)
-            sprint_filter = col1.multiselect("Sprint", sorted(df['Sprint'].dropna().unique()))
+            sprint_filter = col1.multiselect("Sprint", sprint_options(reverse=False), format_func=format_sprint)
             owner_filter = col2.multiselect("Owner", sorted(df['Owner'].unique()))
             status_filter = col3.multiselect("Status", sorted(df['Status'].unique()))
             group_filter = col4.multiselect("Contractor Group", sorted(df['Contractor Group'].unique()))
@@ -213,7 +351,7 @@ if df is not None:
 
             filtered_df = df.copy()
             if sprint_filter:
-                filtered_df = filtered_df[filtered_df['Sprint'].isin(sprint_filter)]
+                filtered_df = filtered_df[filtered_df['Sprint Key'].isin(sprint_filter)]
             if owner_filter:
                 filtered_df = filtered_df[filtered_df['Owner'].isin(owner_filter)]
             if status_filter:
@@ -222,7 +360,7 @@ if df is not None:
                 filtered_df = filtered_df[filtered_df['Contractor Group'].isin(group_filter)]
             if project_filter:
                 # Filter by Planning Level matching the selected projects
-                filtered_df = filtered_df[filtered_df['Planning Level'].isin(project_filter)]
+                filtered_df = filtered_df[in_planning_levels(filtered_df, project_filter)]
 
 
             display_df = filtered_df[['Title', 'ID', 'Owner', 'Contractor Group', 'Status', 'Sprint',
@@ -237,14 +375,14 @@ if df is not None:
                     return 'background-color: #EF553B; color: white'
 
             styled_df = display_df.style.applymap(color_progress, subset=['Progress %'])
-            st.dataframe(display_df, use_container_width=True, height=400)
+            paginated_dataframe(display_df, key="task_progress")
             
         else:
             st.info("Please upload a Version One Excel file to begin.")
 
 
     # --- TAB 2: ➕ Add/Edit Hours ---
-    with tab2:
+    with tab2, profiler.section("tab: Add/Edit Hours"):
         st.header("➕ Add or Update Task Hours")
 
         mode = st.radio("Select Mode", ["Add New Task", "Update Existing Task"], horizontal=True)
@@ -274,12 +412,9 @@ if df is not None:
                 new_todo = st.number_input("To Do Hours*", min_value=0.0, step=0.5, value=0.0)
                 new_backlog = st.text_input("Backlog", value="")
 
-                # Ensure Sprint column is numeric
-                sprint_values = pd.to_numeric(df["Sprint"], errors="coerce").dropna().unique().tolist()
-                sprint_options = sorted(sprint_values)
-                sprint_options.append("Other")
+                new_sprint_options = sprint_dim['Sprint'].tolist() + ["Other"]
 
-                new_sprint = st.selectbox("Sprint*", options=sprint_options)
+                new_sprint = st.selectbox("Sprint*", options=new_sprint_options)
 
                 if new_sprint == "Other":
                     new_sprint = st.text_input("Enter New Sprint Name")
@@ -306,7 +441,7 @@ if df is not None:
                     }
                     new_row_data.update(new_project_hours)
                     new_row = pd.DataFrame([new_row_data])
-                    new_row = process_uploaded_file(new_row)
+                    new_row, _ = process_uploaded_file(new_row)
                     df = pd.concat([df, new_row], ignore_index=True)
                     st.success("Task added successfully!")
                     st.rerun()
@@ -341,7 +476,9 @@ if df is not None:
                 with col2:
                     upd_est_hours = st.number_input("Update Estimated Hours", min_value=0.0, step=0.5, value=float(task_data['Est. Hours']))
                     upd_todo = st.number_input("Update To Do Hours", min_value=0.0, step=0.5, value=float(task_data['To Do']))
-                    upd_sprint = st.selectbox("Update Sprint", options=sorted(df['Sprint'].unique()), index=sorted(df['Sprint'].unique().tolist()).index(task_data['Sprint']))
+                    upd_sprint_options = sprint_dim['Sprint'].tolist()
+                    upd_sprint_idx = upd_sprint_options.index(task_data['Sprint']) if task_data['Sprint'] in upd_sprint_options else 0
+                    upd_sprint = st.selectbox("Update Sprint", options=upd_sprint_options, index=upd_sprint_idx)
 
                 st.subheader("Update Project Hours")
                 project_cols = st.columns(3)
@@ -354,6 +491,7 @@ if df is not None:
                 col_update, col_delete = st.columns([1, 1])
                 with col_update:
                     if st.button("💾 Update Task", type="primary"):
+                        df = df.copy()
                         df.loc[task_idx, 'Owner'] = upd_owner
                         df.loc[task_idx, 'Contractor Group'] = upd_contractor_group
                         df.loc[task_idx, 'Status'] = upd_status
@@ -362,7 +500,7 @@ if df is not None:
                         df.loc[task_idx, 'Sprint'] = upd_sprint
                         for proj, val in upd_project_hours.items():
                             df.loc[task_idx, proj] = val
-                        df = process_uploaded_file(df)
+                        df, level_dim = process_uploaded_file(df)
                         st.success("Task updated successfully!")
                         st.rerun()
 
@@ -373,24 +511,20 @@ if df is not None:
                         st.rerun()
 
     # --- TAB 3: 📋 Sprint Report ---
-    with tab3:
+    with tab3, profiler.section("tab: Sprint Report"):
         st.header("📋 Sprint Report")
 
-        sprints = sorted(df['Sprint'].unique(), reverse=True)
-        selected_sprint = st.selectbox("Select Sprint for Report", options=sprints)
+        selected_sprint = st.selectbox("Select Sprint for Report", options=sprint_options(), format_func=format_sprint)
 
-        sprint_df = df[df['Sprint'] == selected_sprint]
+        sprint_df = filter_sprint(df, selected_sprint)
 
-        sprint_est = sprint_df['Est. Hours'].sum()
-        sprint_completed = sprint_df['Completed Hours'].sum()
-        sprint_remaining = sprint_df['To Do'].sum()
-        sprint_progress = (sprint_completed / sprint_est * 100) if sprint_est > 0 else 0
+        metrics = sprint_metrics(sprint_df)
 
         col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Estimated", f"{sprint_est:,.1f}h")
-        col2.metric("Completed", f"{sprint_completed:,.1f}h")
-        col3.metric("Remaining", f"{sprint_remaining:,.1f}h")
-        col4.metric("Progress", f"{sprint_progress:.1f}%")
+        col1.metric("Total Estimated", f"{metrics['Total Estimated']:,.1f}h")
+        col2.metric("Completed", f"{metrics['Completed']:,.1f}h")
+        col3.metric("Remaining", f"{metrics['Remaining']:,.1f}h")
+        col4.metric("Progress", f"{metrics['Progress']:.1f}%")
 
         st.markdown("---")
 
@@ -398,47 +532,59 @@ if df is not None:
 
         with col1:
             st.subheader("Status Breakdown")
-            status_summary = sprint_df.groupby('Status')['Est. Hours'].sum().reset_index()
-            fig_status = px.pie(status_summary, values='Est. Hours', names='Status', hole=0.4)
-            st.plotly_chart(fig_status, use_container_width=True)
+            def build_status_chart():
+                status_summary = sprint_status_breakdown(sprint_df)
+                return px.pie(status_summary, values='Est. Hours', names='Status', hole=0.4)
+            fig_status = cached_figure("sprint_status", (selected_sprint,), build_status_chart)
+            show_chart(fig_status, "sprint_status")
 
         with col2:
             st.subheader("Contractor Group Breakdown")
-            contractor_sprint = sprint_df.groupby('Contractor Group').agg({
-                'Est. Hours': 'sum',
-                'Completed Hours': 'sum',
-                'To Do': 'sum'
-            }).reset_index().sort_values('Est. Hours', ascending=False)
-
-            fig_contractor_sprint = go.Figure()
-            fig_contractor_sprint.add_trace(go.Bar(name='Completed', y=contractor_sprint['Contractor Group'], x=contractor_sprint['Completed Hours'], orientation='h', marker_color='#00CC96'))
-            fig_contractor_sprint.add_trace(go.Bar(name='To Do', y=contractor_sprint['Contractor Group'], x=contractor_sprint['To Do'], orientation='h', marker_color='#EF553B'))
-            fig_contractor_sprint.update_layout(barmode='stack', height=400, xaxis_title="Hours", yaxis_title="Contractor Group")
-            st.plotly_chart(fig_contractor_sprint, use_container_width=True)
+            def build_contractor_sprint_chart():
+                contractor_sprint = sprint_contractor_breakdown(sprint_df)
+
+                fig = go.Figure()
+                fig.add_trace(go.Bar(name='Completed', y=contractor_sprint['Contractor Group'], x=contractor_sprint['Completed Hours'], orientation='h', marker_color='#00CC96'))
+                fig.add_trace(go.Bar(name='To Do', y=contractor_sprint['Contractor Group'], x=contractor_sprint['To Do'], orientation='h', marker_color='#EF553B'))
+                fig.update_layout(barmode='stack', height=400, xaxis_title="Hours", yaxis_title="Contractor Group")
+                return fig
+            fig_contractor_sprint = cached_figure("sprint_contractor_groups", (selected_sprint,), build_contractor_sprint_chart)
+            show_chart(fig_contractor_sprint, "sprint_contractor_groups")
 
         st.markdown("---")
-        st.subheader(f"📋 {selected_sprint} - Detailed Task List")
+        st.subheader(f"📋 {format_sprint(selected_sprint)} - Detailed Task List")
 
-        report_df = sprint_df[['Title', 'ID', 'Owner', 'Contractor Group', 'Status', 'Est. Hours', 'Completed Hours', 'To Do', 'Progress %'] + PROJECT_COLS].sort_values('Contractor Group')
-        st.dataframe(report_df, use_container_width=True, height=400)
+        report_df = sprint_task_list(sprint_df)
+        paginated_dataframe(report_df, key="sprint_report")
 
-        st.download_button(
+        col1, col2 = st.columns(2)
+        # Downloads take a callable, so an export is only built when someone clicks. It is not cached:
+        # Streamlit's media store already keeps the one copy the download is served from
+        col1.download_button(
             label="📥 Download Sprint Report (CSV)",
-            data=report_df.to_csv(index=False).encode('utf-8'),
-            file_name=f"{selected_sprint}_report_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
+            data=lambda: export_csv(report_df),
+            file_name=f"sprint_{selected_sprint}_report_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv",
+            on_click="ignore"
+        )
+        col2.download_button(
+            label="📦 Download Sprint Pack (Excel)",
+            data=lambda: export_sprint_pack(sprint_df, PROJECT_COLS, SPRINT_REPORT_COLS),
+            file_name=f"sprint_{selected_sprint}_sprint_pack_{datetime.now().strftime('%Y%m%d')}.xlsx",
+            mime=XLSX_MIME,
+            on_click="ignore"
         )
 
     # --- TAB 4: 🏢 Project Tracking ---
-    with tab4:
+    with tab4, profiler.section("tab: Project Tracking"):
         st.header("🏢 Project Tracking")
 
         # Sprint filter
-        all_sprints = ['All Sprints'] + sorted(df['Sprint'].unique().tolist(), reverse=True)
-        selected_sprint_pt = st.selectbox("Filter by Sprint", options=all_sprints, key="project_tracking_sprint")
+        selected_sprint_pt = st.selectbox("Filter by Sprint", options=sprint_options(ALL_SPRINTS),
+                                         format_func=format_sprint, key="project_tracking_sprint")
 
         # Apply sprint filter
-        df_filtered_pt = df.copy() if selected_sprint_pt == 'All Sprints' else df[df['Sprint'] == selected_sprint_pt]
+        df_filtered_pt = filter_sprint(df, selected_sprint_pt)
 
         total_project_hours = df_filtered_pt['Total Project Hours'].sum()
         tasks_with_projects = len(df_filtered_pt[df_filtered_pt['Total Project Hours'] > 0])
@@ -455,38 +601,40 @@ if df is not None:
 
         with col1:
             st.subheader("Hours by Project")
-            project_summary = df_filtered_pt[PROJECT_COLS].sum().reset_index()
-            project_summary.columns = ['Project', 'Hours']
-            project_summary = project_summary[project_summary['Hours'] > 0].sort_values('Hours', ascending=False)
+            project_summary = project_hours_summary(df_filtered_pt)
 
             if not project_summary.empty:
-                fig_proj = px.bar(project_summary, x='Project', y='Hours', color='Hours',
-                                  color_continuous_scale='Blues', height=400)
-                st.plotly_chart(fig_proj, use_container_width=True)
+                fig_proj = cached_figure("project_hours", (selected_sprint_pt,), lambda: px.bar(
+                    project_summary, x='Project', y='Hours', color='Hours', color_continuous_scale='Blues', height=400))
+                show_chart(fig_proj, "project_hours")
             else:
                 st.info("No project hours recorded yet")
 
         with col2:
             st.subheader("Project Distribution")
             if not project_summary.empty:
-                fig_pie = px.pie(project_summary, values='Hours', names='Project', hole=0.4)
-                st.plotly_chart(fig_pie, use_container_width=True)
+                fig_pie = cached_figure("project_distribution", (selected_sprint_pt,), lambda: px.pie(
+                    project_summary, values='Hours', names='Project', hole=0.4))
+                show_chart(fig_pie, "project_distribution")
             else:
                 st.info("No project hours recorded yet")
 
         st.markdown("---")
         st.subheader("Project Hours by Sprint")
 
-        project_by_sprint = df_filtered_pt.groupby('Sprint')[PROJECT_COLS].sum().reset_index()
-        project_by_sprint = project_by_sprint.sort_values('Sprint')
+        def build_project_sprint_chart():
+            project_by_sprint = sum_by_sprint(df_filtered_pt, PROJECT_COLS, sprint_dim)
+            project_by_sprint = bucket_sprints(project_by_sprint, PROJECT_COLS)
 
-        fig_proj_sprint = go.Figure()
-        for proj in PROJECT_COLS:
-            if project_by_sprint[proj].sum() > 0:
-                fig_proj_sprint.add_trace(go.Bar(name=proj, x=project_by_sprint['Sprint'], y=project_by_sprint[proj]))
+            fig = go.Figure()
+            for proj in PROJECT_COLS:
+                if project_by_sprint[proj].sum() > 0:
+                    fig.add_trace(go.Bar(name=proj, x=project_by_sprint['Sprint'], y=project_by_sprint[proj]))
 
-        fig_proj_sprint.update_layout(barmode='stack', height=400, xaxis_title="Sprint", yaxis_title="Hours")
-        st.plotly_chart(fig_proj_sprint, use_container_width=True)
+            fig.update_layout(barmode='stack', height=400, xaxis_title="Sprint", yaxis_title="Hours")
+            return fig
+        fig_proj_sprint = cached_figure("project_hours_by_sprint", (selected_sprint_pt,), build_project_sprint_chart)
+        show_chart(fig_proj_sprint, "project_hours_by_sprint")
 
         st.markdown("---")
         st.subheader("Detailed Project Allocation")
@@ -496,7 +644,7 @@ if df is not None:
                                                       selected_project, 'Est. Hours', 'Progress %']].sort_values(selected_project, ascending=False)
 
         if not project_tasks.empty:
-            st.dataframe(project_tasks, use_container_width=True, height=400)
+            paginated_dataframe(project_tasks, key="project_allocation")
 
             col1, col2 = st.columns(2)
             col1.metric(f"Total {selected_project} Hours", f"{project_tasks[selected_project].sum():,.1f}")
@@ -505,15 +653,15 @@ if df is not None:
             st.info(f"No tasks allocated to {selected_project} yet")
 
     # --- TAB 5: 👥 Contractor Accountability ---
-    with tab5:
+    with tab5, profiler.section("tab: Contractor Accountability"):
         st.header("👥 Contractor Accountability")
 
         # Sprint filter
-        all_sprints_ca = ['All Sprints'] + sorted(df['Sprint'].unique().tolist(), reverse=True)
-        selected_sprint_ca = st.selectbox("Filter by Sprint", options=all_sprints_ca, key="contractor_accountability_sprint")
+        selected_sprint_ca = st.selectbox("Filter by Sprint", options=sprint_options(ALL_SPRINTS),
+                                         format_func=format_sprint, key="contractor_accountability_sprint")
 
         # Apply sprint filter
-        df_filtered_ca = df.copy() if selected_sprint_ca == 'All Sprints' else df[df['Sprint'] == selected_sprint_ca]
+        df_filtered_ca = filter_sprint(df, selected_sprint_ca)
 
         all_contractors = get_all_contractors_with_hours(df_filtered_ca)
 
@@ -552,65 +700,79 @@ if df is not None:
             'To Do': '{:.1f}',
             'Task Count': '{:.0f}'
         })
-        st.dataframe(styled_contractors, use_container_width=True, height=500)
+        with profiler.section("table: contractor_accountability"):
+            st.dataframe(styled_contractors, use_container_width=True, height=500)
 
         st.markdown("---")
         col1, col2 = st.columns(2)
 
         with col1:
             st.subheader("Contractors by Group")
-            group_counts = all_contractors.groupby('Contractor Group').agg({
-                'Owner': 'count',
-                'Task Count': lambda x: (x > 0).sum()
-            }).reset_index()
-            group_counts.columns = ['Contractor Group', 'Total Contractors', 'Active Contractors']
-            group_counts['Inactive'] = group_counts['Total Contractors'] - group_counts['Active Contractors']
-
-            fig_group = go.Figure()
-            fig_group.add_trace(go.Bar(name='Active', x=group_counts['Contractor Group'], y=group_counts['Active Contractors'], marker_color='#00CC96'))
-            fig_group.add_trace(go.Bar(name='Inactive', x=group_counts['Contractor Group'], y=group_counts['Inactive'], marker_color='#EF553B'))
-            fig_group.update_layout(barmode='stack', height=400)
-            st.plotly_chart(fig_group, use_container_width=True)
+            def build_group_chart():
+                group_counts = all_contractors.groupby('Contractor Group').agg({
+                    'Owner': 'count',
+                    'Task Count': lambda x: (x > 0).sum()
+                }).reset_index()
+                group_counts.columns = ['Contractor Group', 'Total Contractors', 'Active Contractors']
+                group_counts['Inactive'] = group_counts['Total Contractors'] - group_counts['Active Contractors']
+
+                fig = go.Figure()
+                fig.add_trace(go.Bar(name='Active', x=group_counts['Contractor Group'], y=group_counts['Active Contractors'], marker_color='#00CC96'))
+                fig.add_trace(go.Bar(name='Inactive', x=group_counts['Contractor Group'], y=group_counts['Inactive'], marker_color='#EF553B'))
+                fig.update_layout(barmode='stack', height=400)
+                return fig
+            fig_group = cached_figure("contractor_groups", (selected_sprint_ca,), build_group_chart)
+            show_chart(fig_group, "contractor_groups")
 
         with col2:
             st.subheader("Top Contributors")
-            top_contributors = all_contractors[all_contractors['Task Count'] > 0].nlargest(10, 'Est. Hours')
-            fig_top = px.bar(top_contributors, x='Owner', y='Est. Hours', color='Contractor Group', height=400)
-            st.plotly_chart(fig_top, use_container_width=True)
+            def build_top_chart():
+                # Only the plotted columns go into the figure so the payload stays at ten points
+                top_contributors = all_contractors.loc[all_contractors['Task Count'] > 0, ['Owner', 'Est. Hours', 'Contractor Group']]
+                top_contributors = top_contributors.nlargest(10, 'Est. Hours')
+                return px.bar(top_contributors, x='Owner', y='Est. Hours', color='Contractor Group', height=400)
+            fig_top = cached_figure("top_contributors", (selected_sprint_ca,), build_top_chart)
+            show_chart(fig_top, "top_contributors")
 
         st.download_button(
             label="📥 Download Contractor Report (CSV)",
-            data=filtered_contractors.to_csv(index=False).encode('utf-8'),
+            data=lambda: export_csv(filtered_contractors),
             file_name=f"contractor_accountability_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
+            mime="text/csv",
+            on_click="ignore"
         )
 
     # --- TAB 6: 📊 Analytics & Trends ---
-    with tab6:
+    with tab6, profiler.section("tab: Analytics"):
         st.header("📊 Analytics & Trends")
 
         # Sprint filter
-        all_sprints_an = ['All Sprints'] + sorted(df['Sprint'].unique().tolist(), reverse=True)
-        selected_sprint_an = st.selectbox("Filter by Sprint", options=all_sprints_an, key="analytics_sprint")
+        selected_sprint_an = st.selectbox("Filter by Sprint", options=sprint_options(ALL_SPRINTS),
+                                         format_func=format_sprint, key="analytics_sprint")
 
         # Apply sprint filter
-        df_filtered_an = df.copy() if selected_sprint_an == 'All Sprints' else df[df['Sprint'] == selected_sprint_an]
+        df_filtered_an = filter_sprint(df, selected_sprint_an)
 
         col1, col2 = st.columns(2)
 
         with col1:
             st.subheader("Sprint Velocity Trend")
-            sprint_velocity = df_filtered_an.groupby('Sprint')['Completed Hours'].sum().reset_index().sort_values('Sprint')
-            fig_velocity = px.line(sprint_velocity, x='Sprint', y='Completed Hours', markers=True,
-                                   line_shape='spline', height=400)
-            fig_velocity.update_traces(line_color='#00CC96', line_width=3)
-            st.plotly_chart(fig_velocity, use_container_width=True)
+            def build_velocity_chart():
+                sprint_velocity = sum_by_sprint(df_filtered_an, ['Completed Hours'], sprint_dim)
+                fig = px.line(sprint_velocity, x='Sprint', y='Completed Hours', markers=True,
+                              line_shape='spline', height=400)
+                fig.update_traces(line_color='#00CC96', line_width=3)
+                return fig
+            fig_velocity = cached_figure("sprint_velocity", (selected_sprint_an,), build_velocity_chart)
+            show_chart(fig_velocity, "sprint_velocity")
 
         with col2:
             st.subheader("Task Status Distribution")
-            status_dist = df_filtered_an.groupby('Status').size().reset_index(name='Count')
-            fig_status_dist = px.bar(status_dist, x='Status', y='Count', color='Status', height=400)
-            st.plotly_chart(fig_status_dist, use_container_width=True)
+            def build_status_dist_chart():
+                status_dist = df_filtered_an.groupby('Status').size().reset_index(name='Count')
+                return px.bar(status_dist, x='Status', y='Count', color='Status', height=400)
+            fig_status_dist = cached_figure("status_distribution", (selected_sprint_an,), build_status_dist_chart)
+            show_chart(fig_status_dist, "status_distribution")
 
         st.markdown("---")
         st.subheader("Top 10 Tasks by Hours")
@@ -618,47 +780,55 @@ if df is not None:
         top_tasks = df_filtered_an.nlargest(10, 'Est. Hours')[['Title', 'Owner', 'Contractor Group', 'Sprint',
                                                    'Est. Hours', 'Completed Hours', 'To Do',
                                                    'Progress %', 'Total Project Hours']]
-        st.dataframe(top_tasks, use_container_width=True)
+        with profiler.section("table: top_tasks"):
+            st.dataframe(top_tasks, use_container_width=True)
 
         st.markdown("---")
         st.subheader("Contractor Group Performance")
 
-        contractor_perf = df_filtered_an.groupby('Contractor Group').agg({
-            'Title': 'count',
-            'Est. Hours': 'sum',
-            'Completed Hours': 'sum',
-            'To Do': 'sum',
-            'Total Project Hours': 'sum'
-        }).reset_index()
-        contractor_perf.columns = ['Contractor Group', 'Task Count', 'Total Est. Hours',
-                                   'Completed Hours', 'Remaining Hours', 'Project Hours']
-        contractor_perf['Completion Rate %'] = ((contractor_perf['Completed Hours'] /
-                                                 contractor_perf['Total Est. Hours']) * 100).round(1)
-        contractor_perf = contractor_perf.sort_values('Completed Hours', ascending=False)
-
-        st.dataframe(contractor_perf, use_container_width=True)
+        contractor_perf = contractor_performance(df_filtered_an)
+
+        with profiler.section("table: contractor_performance"):
+            st.dataframe(contractor_perf, use_container_width=True)
       
     # --- TAB 7: 📂 Backlog Tasks ---
-    with tab7:
+    with tab7, profiler.section("tab: Backlog Tasks"):
         st.header("📂 Backlog Tasks")
 
         # Sprint filter
-        all_sprints_bl = ['All Sprints'] + sorted(df['Sprint'].unique().tolist(), reverse=True)
-        selected_sprint_bl = st.selectbox("Filter by Sprint", options=all_sprints_bl, key="backlog_sprint")
+        selected_sprint_bl = st.selectbox("Filter by Sprint", options=sprint_options(ALL_SPRINTS),
+                                         format_func=format_sprint, key="backlog_sprint")
 
         # Apply sprint filter
-        df_filtered_bl = df.copy() if selected_sprint_bl == 'All Sprints' else df[df['Sprint'] == selected_sprint_bl]
+        df_filtered_bl = filter_sprint(df, selected_sprint_bl)
 
-        backlog_df = df_filtered_bl[df_filtered_bl['Backlog'].notna() & (df_filtered_bl['Backlog'].str.strip() != '')]
+        backlog_df = backlog_tasks(df_filtered_bl)
 
         if backlog_df.empty:
             st.info("No backlog tasks found.")
         else:
-            st.dataframe(backlog_df[['Title', 'ID', 'Owner', 'Contractor Group', 'Status', 'Sprint',
-                                     'Backlog', 'Est. Hours', 'To Do', 'Completed Hours', 'Progress %']],
-                         use_container_width=True, height=400)
+            paginated_dataframe(backlog_df[['Title', 'ID', 'Owner', 'Contractor Group', 'Status', 'Sprint',
+                                            'Backlog', 'Est. Hours', 'To Do', 'Completed Hours', 'Progress %']],
+                                key="backlog_tasks")
 
 
 st.markdown("---")
-eastern_time = datetime.now(ZoneInfo("America/New_York"))
-st.caption(f"Last refreshed: {eastern_time.strftime('%Y-%m-%d %I:%M:%S %p ET')} | Data Engineering Team")
+
+def data_status_footer():
+    # Reruns on its own timer; when the watcher has finished warming up or swapped in newer data, rerun the
+    # whole page once
+    if watcher and (warming and watcher.ready.is_set() or watcher.snapshot and watcher.snapshot.version != data_version):
+        st.rerun(scope="app")
+    if snapshot:
+        source = data_version.split('|')[0] if data_version.startswith("arrow-") else os.path.basename(snapshot.source)
+        scraped = scraped_at.astimezone(ZoneInfo("America/New_York"))
+        st.caption(f"Data version: {source} | Scraped: {scraped.strftime('%Y-%m-%d %I:%M:%S %p ET')} | Data Engineering Team")
+    else:
+        st.caption(f"Data version: {'uploaded file' if data_version else 'none'} | Data Engineering Team")
+
+poll_seconds = st.session_state.setdefault(
+    "_data_poll_seconds", SESSION_POLL_SECONDS + random.uniform(0, SESSION_POLL_JITTER_SECONDS))
+st.fragment(run_every=WARMUP_POLL_SECONDS if warming else poll_seconds)(data_status_footer)()
+if df is not None:
+    mark_cold_start("full_render")
+profiler.render_panel((snapshot.loaded_at, snapshot.load_seconds) if snapshot else None)
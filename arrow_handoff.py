@@ -0,0 +1,87 @@
+import json
+import os
+from datetime import datetime
+
+# Hands the merged frame from merge_tasklists to app.py as an uncompressed Arrow IPC file.
+# Every publish writes a new tasks_v{N}.arrow and then atomically replaces current.json, which
+# names it. Files are never rewritten in place, because Windows cannot replace a file that a
+# dashboard process is still reading. This is a fast-parse handoff: readers load the whole file in one
+# read and close it, skipping the xlsx/CSV parse. Each dashboard process holds its own copy (string
+# columns are materialised and process_tasks copies again), so nothing is shared between processes.
+# Readers notice a refresh by the version counter.
+# pyarrow ships with streamlit; it is imported lazily so the scraper still runs without it.
+HANDOFF_DIR = "handoff"
+POINTER_FILE = "current.json"
+KEEP_VERSIONS = 3
+
+
+def current_version(handoff_dir=HANDOFF_DIR):
+    # The pointer is a few bytes of JSON, cheap enough to check on every dashboard rerun
+    try:
+        with open(os.path.join(handoff_dir, POINTER_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _arrow_ready(frame):
+    # Arrow columns are single-typed; xlsx object columns can mix numbers and text (e.g. Sprint)
+    frame = frame.copy()
+    for col in frame.columns[frame.dtypes == object]:
+        values = frame[col]
+        frame[col] = values.where(values.isna(), values.astype(str))
+    return frame
+
+
+def publish_frame(frame, handoff_dir=HANDOFF_DIR, keep=KEEP_VERSIONS):
+    import pyarrow as pa
+
+    os.makedirs(handoff_dir, exist_ok=True)
+    pointer = current_version(handoff_dir)
+    version = (pointer["version"] if pointer else 0) + 1
+    name = f"tasks_v{version}.arrow"
+    path = os.path.join(handoff_dir, name)
+
+    table = pa.Table.from_pandas(_arrow_ready(frame), preserve_index=False)
+    with pa.OSFile(path + ".tmp", "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(path + ".tmp", path)
+
+    pointer = {"version": version, "file": name, "rows": table.num_rows,
+               "written_at": datetime.now().isoformat(timespec="seconds")}
+    with open(os.path.join(handoff_dir, POINTER_FILE + ".tmp"), "w", encoding="utf-8") as f:
+        json.dump(pointer, f)
+    os.replace(os.path.join(handoff_dir, POINTER_FILE + ".tmp"), os.path.join(handoff_dir, POINTER_FILE))
+
+    remove_old_versions(handoff_dir, version - keep + 1)
+    return pointer
+
+
+def remove_old_versions(handoff_dir, oldest_kept):
+    # Best effort: a version a dashboard process is still reading cannot be deleted on Windows, so it
+    # is skipped and tried again after the next publish
+    for name in os.listdir(handoff_dir):
+        if name.startswith("tasks_v") and name.endswith(".arrow") and int(name[7:-6]) < oldest_kept:
+            try:
+                os.remove(os.path.join(handoff_dir, name))
+            except OSError:
+                pass
+
+
+def read_frame(path):
+    import pyarrow as pa
+
+    # Read into memory and close the file at once, so a loaded version never blocks its pruning
+    with pa.OSFile(path, "rb") as source:
+        table = pa.ipc.open_file(source).read_all()
+    frame = table.to_pandas()
+    for col in frame.columns[frame.dtypes == object]:
+        # Arrow nulls come back as None; process_tasks expects NaN like the xlsx/CSV readers give
+        frame[col] = frame[col].fillna(float("nan"))
+    return frame
+
+
+def current_path(handoff_dir=HANDOFF_DIR):
+    pointer = current_version(handoff_dir)
+    return (os.path.join(handoff_dir, pointer["file"]), pointer) if pointer else (None, None)
@@ -0,0 +1,166 @@
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timedelta
+
+# Failure screenshots (and, with SCRAPER_CAPTURE_DOM=1, gzipped DOM snapshots) from the scraper.
+# They live under logs/artifacts, outside the published tree. Files are named by content hash, so
+# a screen that fails the same way twice is stored once. Screenshots are viewport-sized JPEGs instead
+# of PNGs. index.json lists failures per planning level, and retention drops failures older than
+# MAX_AGE_DAYS, then the oldest ones, until the store fits MAX_BYTES. Imported legacy screenshots are
+# exempt from the age limit (they are all older than it) but still count against the size budget.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARTIFACT_DIR = os.path.join(BASE_DIR, "logs", "artifacts")
+MAX_BYTES = 50 * 1024 * 1024
+MAX_AGE_DAYS = 30
+JPEG_QUALITY = 60
+CAPTURE_DOM = os.environ.get("SCRAPER_CAPTURE_DOM") == "1"
+# Screenshot names written to the repo root before the store existed
+LEGACY_PATTERNS = ["error_*.png", "no_apply_button_*.png", "apply_button_debug_*.png"]
+
+
+def _index_path(store_dir):
+    return os.path.join(store_dir, "index.json")
+
+
+def load_index(store_dir=ARTIFACT_DIR):
+    path = _index_path(store_dir)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {"levels": {}}
+
+
+def save_index(index, store_dir=ARTIFACT_DIR):
+    tmp_path = _index_path(store_dir) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, _index_path(store_dir))
+
+
+def store_bytes(data, ext, store_dir=ARTIFACT_DIR):
+    name = f"{hashlib.sha256(data).hexdigest()[:20]}.{ext}"
+    path = os.path.join(store_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(store_dir, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    return name
+
+
+def record_failure(level, kind, screenshot=None, dom=None, error=None, ext="jpg", when=None, imported=False,
+                   retain=True, store_dir=ARTIFACT_DIR):
+    entry = {"ts": (when or datetime.now()).isoformat(timespec="seconds"), "kind": kind}
+    if imported:
+        entry["imported"] = True
+    if error:
+        entry["error"] = error[:500]
+    if screenshot:
+        entry["screenshot"] = store_bytes(screenshot, ext, store_dir)
+    if dom:
+        entry["dom"] = store_bytes(gzip.compress(dom.encode("utf-8"), mtime=0), "html.gz", store_dir)
+    index = load_index(store_dir)
+    index["levels"].setdefault(level, []).append(entry)
+    if retain:
+        enforce_retention(index, store_dir)
+    save_index(index, store_dir)
+    return entry
+
+
+def capture_failure(page, level, kind, error=None, dom=CAPTURE_DOM, store_dir=ARTIFACT_DIR):
+    # Called from except blocks, so it must never raise
+    try:
+        screenshot = page.screenshot(type="jpeg", quality=JPEG_QUALITY)
+        entry = record_failure(level, kind, screenshot, page.content() if dom else None, error, store_dir=store_dir)
+        print(f"[INFO] Saved failure screenshot {entry['screenshot']} for {level} ({kind})")
+    except Exception as e:
+        print(f"[WARN] Could not capture failure artifacts for {level}: {e}")
+
+
+def enforce_retention(index, store_dir=ARTIFACT_DIR, max_bytes=MAX_BYTES, max_age_days=MAX_AGE_DAYS):
+    cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat(timespec="seconds")
+    failures = sorted(((e["ts"], level, e) for level, entries in index["levels"].items() for e in entries),
+                      key=lambda f: f[0])
+    failures = [f for f in failures if f[0] >= cutoff or f[2].get("imported")]
+
+    def referenced(kept):
+        return {e[key] for _, _, e in kept for key in ("screenshot", "dom") if key in e}
+
+    sizes = {name: os.path.getsize(os.path.join(store_dir, name))
+             for name in os.listdir(store_dir) if name != "index.json" and not name.endswith(".tmp")} \
+        if os.path.isdir(store_dir) else {}
+    # Drop the oldest failures until the files they still reference fit the budget
+    while failures and sum(sizes.get(name, 0) for name in referenced(failures)) > max_bytes:
+        failures.pop(0)
+
+    keep = referenced(failures)
+    for name in sizes:
+        if name not in keep:
+            os.remove(os.path.join(store_dir, name))
+    index["levels"] = {}
+    for _, level, entry in failures:
+        index["levels"].setdefault(level, []).append(entry)
+    return index
+
+
+def import_legacy(src_dir=BASE_DIR, store_dir=ARTIFACT_DIR):
+    # Moves old root-level screenshots into the store, keeping their level and timestamp. Retention runs
+    # once after the whole batch; a screenshot the size budget drops is left where it was, not deleted.
+    imported = []
+    for pattern in LEGACY_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(glob.escape(src_dir), pattern))):
+            name = os.path.basename(path)
+            match = re.match(r"(error_reset_cdas|error|no_apply_button|apply_button_debug)_(.+?)(?:_(\d{8}_\d{6}))?\.png$", name)
+            if not match:
+                continue
+            kind, level, stamp = match.groups()
+            if kind == "error_reset_cdas":
+                kind, level, stamp = "reset", "CDAS - 6441", match.group(2)
+            when = datetime.strptime(stamp, "%Y%m%d_%H%M%S") if stamp else datetime.fromtimestamp(os.path.getmtime(path))
+            with open(path, "rb") as f:
+                entry = record_failure(level, kind, f.read(), ext="png", when=when, imported=True, retain=False,
+                                       store_dir=store_dir)
+            imported.append((path, entry["screenshot"]))
+
+    save_index(enforce_retention(load_index(store_dir), store_dir), store_dir)
+    moved = 0
+    for path, name in imported:
+        if os.path.exists(os.path.join(store_dir, name)):
+            os.remove(path)
+            moved += 1
+    return moved, len(imported) - moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper failure artifacts")
+    sub = parser.add_subparsers(dest="command", required=True)
+    listing = sub.add_parser("list", help="Failures per planning level")
+    listing.add_argument("--level", default=None)
+    sub.add_parser("import-legacy", help="Move error_*.png and other old screenshots from the repo root into the store")
+    args = parser.parse_args()
+
+    if args.command == "import-legacy":
+        moved, kept_in_place = import_legacy()
+        print(f"[INFO] Moved {moved} screenshots into {ARTIFACT_DIR}")
+        if kept_in_place:
+            print(f"[WARN] {kept_in_place} screenshots did not fit the {MAX_BYTES / 1024 / 1024:.0f} MB budget "
+                  f"and were left in place")
+        return
+
+    index = load_index()
+    for level, entries in sorted(index["levels"].items()):
+        if args.level and level != args.level:
+            continue
+        print(f"{level}: {len(entries)} failures, last {entries[-1]['ts']}")
+        for e in entries[-10:]:
+            print(f"  {e['ts']}  {e['kind']:<20}{e.get('screenshot', ''):<28}{e.get('error', '')[:60]}")
+    total = sum(os.path.getsize(p) for p in glob.glob(os.path.join(glob.escape(ARTIFACT_DIR), "*")))
+    print(f"[INFO] Store size {total / 1024:,.0f} KB (budget {MAX_BYTES / 1024 / 1024:.0f} MB, {MAX_AGE_DAYS} days)")
+
+
+if __name__ == "__main__":
+    main()
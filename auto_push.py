@@ -1,44 +1,120 @@
 import subprocess
 import os
-from datetime import datetime
+from run_metrics import span
+from automation_logging import get_logger
+from dashboard_data import PUBLISHED_CSV
 
-def push_to_github():
+# Only the published data is committed: the sorted CSV written by merge_tasklists. The sprint reports are
+# not (they are ~700 files / ~40 MB on live data); anyone who needs them runs `python batch_reports.py`
+# on the CSV. Nothing is committed when the CSV is unchanged, but a branch still ahead of origin
+# (a push that failed during an outage) is pushed again.
+# "main" commits to the checked-out branch. "branch" commits a snapshot of HEAD with the data swapped in
+# to DATA_BRANCH without touching the working tree; that branch is re-rooted once it holds
+# MAX_DATA_COMMITS commits so its history stays bounded (deploy the dashboard from it).
+PUBLISH_MODE = os.environ.get("DASHBOARD_PUBLISH_MODE", "main")
+DATA_BRANCH = "data"
+MAX_DATA_COMMITS = 50
+COMMIT_MESSAGE = "Auto-update task_quicklist data"
+
+def git(*args, env=None):
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True, env=env).stdout.strip()
+
+def git_optional(*args):
+    # For lookups where "not found" is an answer rather than an error
+    result = subprocess.run(["git", *args], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def data_changed(ref):
+    return git("hash-object", "--", PUBLISHED_CSV) != git_optional("rev-parse", "--verify", "-q", f"{ref}:{PUBLISHED_CSV}")
+
+def unpushed(branch):
+    # The remote-tracking ref only moves on a successful push, so a difference means origin is behind
+    local = git_optional("rev-parse", "--verify", "-q", f"refs/heads/{branch}")
+    return local is not None and local != git_optional("rev-parse", "--verify", "-q", f"refs/remotes/origin/{branch}")
+
+def push_branch(log, branch):
+    remote = git_optional("rev-parse", "--verify", "-q", f"refs/remotes/origin/{branch}")
+    # A re-rooted data branch no longer contains origin's tip, so it has to be forced
+    force = branch == DATA_BRANCH and remote is not None and \
+        git_optional("merge-base", "--is-ancestor", remote, f"refs/heads/{branch}") is None
+    log.info(f"Git push ({branch})")
+    with span("git_push"):
+        git("push", "origin", f"{'+' if force else ''}refs/heads/{branch}:refs/heads/{branch}")
+
+def publish_to_main(log):
+    # Stage and commit by pathspec so nothing else in the checkout (screenshots, exports, logs) is picked up
+    with span("git_add"):
+        git("add", "--", PUBLISHED_CSV)
+    with span("git_commit"):
+        git("commit", "-m", COMMIT_MESSAGE, "--", PUBLISHED_CSV)
+    push_branch(log, "main")
+
+def publish_to_branch(log, branch=DATA_BRANCH, max_commits=MAX_DATA_COMMITS):
+    ref = f"refs/heads/{branch}"
+    parent = git_optional("rev-parse", "--verify", "-q", ref)
+
+    with span("git_snapshot"):
+        # Build the tree in a throwaway index so the working tree, HEAD and the real index are untouched
+        index_file = os.path.join(git("rev-parse", "--git-dir"), "publish-index")
+        env = {**os.environ, "GIT_INDEX_FILE": index_file}
+        try:
+            git("read-tree", "HEAD", env=env)
+            blob = git("hash-object", "-w", "--", PUBLISHED_CSV)
+            git("update-index", "--add", "--cacheinfo", f"100644,{blob},{PUBLISHED_CSV}", env=env)
+            tree = git("write-tree", env=env)
+        finally:
+            if os.path.exists(index_file):
+                os.remove(index_file)
+
+        reroot = parent is not None and int(git("rev-list", "--count", parent)) >= max_commits
+        parents = ["-p", parent] if parent and not reroot else []
+        commit = git("commit-tree", tree, *parents, "-m", COMMIT_MESSAGE)
+        git("update-ref", ref, commit, parent or "0" * 40)
+
+    if reroot:
+        log.info(f"Re-rooted {branch} after {max_commits} commits")
+    push_branch(log, branch)
+
+def push_to_github(mode=PUBLISH_MODE):
     repo_path = "C:/Users/tbh2j0/OneDrive - USPS/Test Folder/versionone_dashboard"
     os.chdir(repo_path)
 
-    log_file = os.path.join(repo_path, "automation_log.txt")
+    log = get_logger("push")
 
     try:
-        with open(log_file, "a", encoding="utf-8") as log:
-            log.write(f"[INFO] Git add at {datetime.now()}\n")
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
-
-        with open(log_file, "a", encoding="utf-8") as log:
-            log.write(f"[INFO] Git commit at {datetime.now()}\n")
-        result = subprocess.run(["git", "commit", "-m", "Auto-update task_quicklist.xlsx"],
-                              capture_output=True, text=True)
-
-        if result.returncode != 0:
-            if "nothing to commit" in result.stdout:
-                with open(log_file, "a", encoding="utf-8") as log:
-                    log.write(f"[INFO] No changes to commit at {datetime.now()}\n")
+        if not os.path.exists(PUBLISHED_CSV):
+            log.warning(f"{PUBLISHED_CSV} not found, nothing to publish")
+            return
+        branch = "main" if mode == "main" else DATA_BRANCH
+        if not data_changed("HEAD" if mode == "main" else DATA_BRANCH):
+            if not unpushed(branch):
+                log.info("No changes to commit")
                 return
-            else:
-                raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+            log.info(f"No changes to commit; retrying the push of {branch}, which is ahead of origin")
+            push_branch(log, branch)
+            log.info("Git push complete")
+            return
 
-        with open(log_file, "a", encoding="utf-8") as log:
-            log.write(f"[INFO] Git push at {datetime.now()}\n")
-        subprocess.run(["git", "push", "origin", "main"], check=True, capture_output=True, text=True)
+        log.info(f"Publishing data ({mode})")
+        if mode == "branch":
+            publish_to_branch(log)
+        else:
+            publish_to_main(log)
 
-        with open(log_file, "a", encoding="utf-8") as log:
-            log.write(f"[SUCCESS] Git push complete at {datetime.now()}\n")
+        log.info("Git push complete")
 
     except subprocess.CalledProcessError as e:
-        with open(log_file, "a", encoding="utf-8") as log:
-            log.write(f"[ERROR] Git failed at {datetime.now()}: {e}\n")
-            log.write(f"[ERROR] stdout: {e.stdout}\n")
-            log.write(f"[ERROR] stderr: {e.stderr}\n")
+        log.error(f"Git failed: {e}", extra={"cause": f"git {e.cmd[1]} exit {e.returncode}",
+                                             "stdout": e.stdout, "stderr": e.stderr})
 
 if __name__ == "__main__":
-    push_to_github()
-
+    import argparse
+    from run_metrics import start_run, finish_run
+    parser = argparse.ArgumentParser(description="Publish the scraped data to GitHub")
+    parser.add_argument("--mode", choices=["main", "branch"], default=PUBLISH_MODE)
+    args = parser.parse_args()
+    start_run("push")
+    try:
+        push_to_github(args.mode)
+    finally:
+        finish_run()
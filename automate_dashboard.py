@@ -1,37 +1,61 @@
 import os
 os.environ["PLAYWRIGHT_SKIP_VALIDATE_DEPENDENCIES"] = "1"
 from playwright_advanced import run_playwright
-from datetime import datetime
+from run_metrics import start_run, finish_run, span
+from automation_logging import get_logger
 
 # Set environment variable to skip Playwright dependency validation
 os.environ["PLAYWRIGHT_SKIP_VALIDATE_DEPENDENCIES"] = "1"
 
-# Confirm script is being reached
-with open("automation_log.txt", "a", encoding="utf-8", errors="replace") as log:
-    log.write(f"[DEBUG] Script reached at {datetime.now()}\n")
-
-# Import and run Playwright
-from playwright_advanced import run_playwright
-
-with open("automation_log.txt", "a", encoding="utf-8", errors="replace") as log:
-    log.write(f"[INFO] Starting Playwright at {datetime.now()}\n")
-
-try:
-    run_playwright()
-    with open("automation_log.txt", "a", encoding="utf-8", errors="replace") as log:
-        log.write(f"[INFO] Playwright completed at {datetime.now()}\n")
-
-    # Push to GitHub after successful scraping
-    from auto_push import push_to_github
-    with open("automation_log.txt", "a", encoding="utf-8", errors="replace") as log:
-        log.write(f"[INFO] Starting git push at {datetime.now()}\n")
-
-    push_to_github()
-
-    with open("automation_log.txt", "a", encoding="utf-8", errors="replace") as log:
-        log.write(f"[INFO] Git push completed at {datetime.now()}\n")
-
-except Exception as e:
-    with open("automation_log.txt", "a", encoding="utf-8", errors="replace") as log:
-        log.write(f"[ERROR] Workflow failed: {str(e)}\n")
-
+# Records go to logs/automation.jsonl (see `python automation_logging.py failures`)
+log = get_logger("pipeline")
+
+
+def run_pipeline(planning_levels=None):
+    # Scrape (all levels, or only planning_levels), render sprint reports and push.
+    # Returns the planning levels whose export failed; raises if the workflow itself failed.
+    log.info("Starting Playwright", extra={"event": "run_start", "levels": planning_levels or "all"})
+
+    # Per-step timings for this run go to logs/run_metrics.jsonl (see `python run_metrics.py summary`)
+    start_run("pipeline")
+    run_status = "ok"
+    try:
+        with span("scrape"):
+            failed_levels = run_playwright(planning_levels=planning_levels)
+        log.info("Playwright completed", extra={"event": "scrape_done", "failed_levels": failed_levels})
+
+        # Render every sprint report for local use; reports/ is not committed (see auto_push.py)
+        from batch_reports import generate_all_reports
+        log.info("Generating sprint reports")
+        try:
+            with span("sprint_reports"):
+                generate_all_reports()
+            log.info("Sprint reports completed")
+        except Exception:
+            log.exception("Sprint report generation failed", extra={"step": "sprint_reports"})
+
+        # Push to GitHub after successful scraping
+        from auto_push import push_to_github
+        log.info("Starting git push")
+
+        with span("push"):
+            push_to_github()
+
+        log.info("Git push completed", extra={"event": "push_done"})
+        return failed_levels
+
+    except Exception:
+        run_status = "error"
+        raise
+    finally:
+        finish_run(run_status)
+        log.info("Run finished", extra={"event": "run_end", "status": run_status})
+
+
+# Everything below must stay under the main guard: the report workers re-import this module on Windows
+if __name__ == "__main__":
+    log.debug("Script reached")
+    try:
+        run_pipeline()
+    except Exception:
+        log.exception("Workflow failed", extra={"step": "pipeline"})
@@ -0,0 +1,227 @@
+import argparse
+import glob
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import re
+import shutil
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+# Shared log for the scrape -> merge -> push pipeline. Records are buffered in memory and written as
+# JSON lines to logs/automation.jsonl, which rolls over by size or age into gzipped segments
+# (automation.jsonl.1.gz is the newest). `python automation_logging.py failures|runs` queries them.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_FILE = os.path.join(BASE_DIR, "logs", "automation.jsonl")
+LEGACY_LOG_FILE = os.path.join(BASE_DIR, "automation_log.txt")
+LOGGER_NAME = "automation"
+MAX_BYTES = 5 * 1024 * 1024
+MAX_AGE_DAYS = 7
+BACKUP_COUNT = 52
+BUFFER_RECORDS = 100
+FLUSH_SECONDS = 30
+
+# Record attributes set by logging itself; anything else passed via extra= is written as a field
+_STANDARD_ATTRS = set(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime"}
+_configured = False
+
+
+def failure_cause(message):
+    # Collapse an error message to a groupable cause, e.g. ERR_NAME_NOT_RESOLVED or "Locator.click timeout"
+    match = re.search(r"net::(ERR_[A-Z_]+)", message)
+    if match:
+        return match.group(1)
+    match = re.search(r"(\w+\.\w+): Timeout", message)
+    if match:
+        return f"{match.group(1)} timeout"
+    if "Executable doesn't exist" in message:
+        return "browser not installed"
+    return message.split(":")[0].strip()[:60] or "unknown"
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        entry.update({k: v for k, v in record.__dict__.items() if k not in _STANDARD_ATTRS})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        if record.levelno >= logging.ERROR and "cause" not in entry:
+            entry["cause"] = failure_cause(str(record.exc_info[1]) if record.exc_info else entry["msg"])
+        return json.dumps(entry, default=str)
+
+
+def _gzip_rotator(source, dest):
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+class RotatingJsonlHandler(logging.handlers.RotatingFileHandler):
+    # RotatingFileHandler rolls over on size; this also rolls a segment once it is max_age_days old
+    def __init__(self, filename, max_bytes=MAX_BYTES, max_age_days=MAX_AGE_DAYS, backup_count=BACKUP_COUNT):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = _gzip_rotator
+        self.max_age = max_age_days * 86400
+        self.segment_started = self._first_record_time(filename)
+
+    @staticmethod
+    def _first_record_time(filename):
+        try:
+            with open(filename, encoding="utf-8") as f:
+                return datetime.fromisoformat(json.loads(f.readline())["ts"]).timestamp()
+        except (OSError, ValueError, KeyError):
+            return time.time()
+
+    def shouldRollover(self, record):
+        if super().shouldRollover(record):
+            return True
+        return record.created - self.segment_started >= self.max_age and os.path.getsize(self.baseFilename) > 0
+
+    def doRollover(self):
+        super().doRollover()
+        self.segment_started = time.time()
+
+
+class BufferedHandler(logging.handlers.MemoryHandler):
+    # Flushes when the buffer fills, on ERROR and above, or once FLUSH_SECONDS have passed
+    def __init__(self, target, capacity=BUFFER_RECORDS, flush_seconds=FLUSH_SECONDS):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self.flush_seconds = flush_seconds
+        self.last_flush = time.monotonic()
+        self._stop_flushing = threading.Event()
+        threading.Thread(target=self._flush_periodically, name="log-flush", daemon=True).start()
+
+    def shouldFlush(self, record):
+        return super().shouldFlush(record) or time.monotonic() - self.last_flush >= self.flush_seconds
+
+    def _flush_periodically(self):
+        # shouldFlush only runs when a record arrives, and scheduler.py can sleep 30 minutes between
+        # records; without this a killed scheduler would lose everything logged before its last sleep
+        while not self._stop_flushing.wait(self.flush_seconds):
+            if self.buffer:
+                self.flush()
+
+    def flush(self):
+        super().flush()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+def get_logger(name=None, log_file=LOG_FILE):
+    # Handlers are attached once per process to the "automation" logger; logging.shutdown() flushes them at exit
+    global _configured
+    logger = logging.getLogger(LOGGER_NAME)
+    if not _configured:
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        file_handler = RotatingJsonlHandler(log_file)
+        file_handler.setFormatter(JsonFormatter())
+        logger.addHandler(BufferedHandler(file_handler))
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        logger.addHandler(console)
+        _configured = True
+    return logger.getChild(name) if name else logger
+
+
+def log_segments(log_file=LOG_FILE):
+    # Oldest segment first so records come out in time order
+    rotated = glob.glob(f"{glob.escape(log_file)}.*.gz")
+    rotated.sort(key=lambda p: int(p[len(log_file) + 1:-3]), reverse=True)
+    return rotated + ([log_file] if os.path.exists(log_file) else [])
+
+
+def read_records(log_file=LOG_FILE):
+    for path in log_segments(log_file):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def read_legacy_records(path=LEGACY_LOG_FILE):
+    # automation_log.txt lines look like "[LEVEL] message at <timestamp>"; error lines carry no timestamp,
+    # so they take the last one seen
+    last_ts = None
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            match = re.match(r"\[(\w+)\] (.*)", line.strip())
+            if not match:
+                continue
+            level, msg = match.groups()
+            ts = re.search(r" at (\d{4}-\d{2}-\d{2}) (\d{2}:\d{2}:\d{2})[.\d]*", msg)
+            if ts:
+                last_ts = f"{ts.group(1)}T{ts.group(2)}"
+                msg = msg.replace(ts.group(0), "")
+            if msg.startswith(("stdout:", "stderr:")):
+                continue
+            record = {"ts": last_ts, "level": level, "logger": "legacy", "msg": msg}
+            if msg.startswith("Starting Playwright"):
+                record["event"] = "run_start"
+            if level == "ERROR":
+                detail = msg.split("failed: ", 1)[1] if "failed: " in msg else msg.split(": ", 1)[-1]
+                record["cause"] = failure_cause(detail)
+            yield record
+
+
+def failures_by_cause(records):
+    return Counter(r["cause"] for r in records if r["level"] == "ERROR" and r.get("cause"))
+
+
+def runs_per_day(records):
+    days = {}
+    for r in records:
+        if not r.get("ts"):
+            continue
+        day = days.setdefault(r["ts"][:10], {"runs": 0, "errors": 0})
+        if r.get("event") == "run_start":
+            day["runs"] += 1
+        elif r["level"] == "ERROR":
+            day["errors"] += 1
+    return sorted(days.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the automation log")
+    parser.add_argument("command", choices=["failures", "runs"])
+    parser.add_argument("--file", default=LOG_FILE)
+    parser.add_argument("--legacy", action="store_true", help="Also read the old automation_log.txt")
+    parser.add_argument("--since", default=None, help="Only records on or after this date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    records = list(read_records(args.file))
+    if args.legacy and os.path.exists(LEGACY_LOG_FILE):
+        records = list(read_legacy_records()) + records
+    if args.since:
+        records = [r for r in records if r.get("ts") and r["ts"][:10] >= args.since]
+    if not records:
+        print(f"[INFO] No log records in {args.file}")
+        return
+
+    if args.command == "failures":
+        print(f"{'cause':<50}{'count':>7}")
+        for cause, count in failures_by_cause(records).most_common():
+            print(f"{cause:<50}{count:>7}")
+    else:
+        print(f"{'day':<12}{'runs':>6}{'errors':>8}")
+        for day, counts in runs_per_day(records):
+            print(f"{day:<12}{counts['runs']:>6}{counts['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from dashboard_data import (CONTRACTOR_FILE, NO_SPRINT_KEY, PUBLISHED_CSV, read_task_export, read_contractor_file,
+                            process_task_levels, level_membership, sprint_name,
+                            sprint_metrics, sprint_status_breakdown, sprint_contractor_breakdown, sprint_task_list)
+from report_export import export_csv
+
+# Renders the Sprint Report tab for every sprint and planning level without Streamlit. Pages carry no
+# wall-clock timestamp, so a sprint whose data has not changed is rewritten byte-for-byte identical and
+# the committed reports/ only change where the data did.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(BASE_DIR, PUBLISHED_CSV)
+if not os.path.exists(DATA_FILE):
+    DATA_FILE = os.path.join(BASE_DIR, "task_quicklist.xlsx")
+CONTRACTOR_PATH = os.path.join(BASE_DIR, CONTRACTOR_FILE)
+REPORT_DIR = os.path.join(BASE_DIR, "reports")
+ALL_LEVELS = "All Planning Levels"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 24px; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 8px; text-align: left; }}
+th {{ background: #f0f2f6; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p>Data Engineering Team</p>
+{body}
+</body>
+</html>
+"""
+
+
+def load_tasks(data_file=DATA_FILE, contractor_file=CONTRACTOR_PATH):
+    # (tasks, level membership)
+    raw_df = read_task_export(data_file)
+    return process_task_levels(raw_df, read_contractor_file(contractor_file))
+
+
+def level_tag(planning_level):
+    # Same tag scheme as the tasklist_*.xlsx exports
+    return "all" if planning_level == ALL_LEVELS else planning_level.replace(" ", "").replace("-", "")
+
+
+def _table(frame):
+    return frame.to_html(index=False, border=0, float_format=lambda v: f"{v:,.1f}")
+
+
+def render_sprint_report(job):
+    planning_level, sprint, sprint_df, out_dir = job
+    level_dir = os.path.join(out_dir, level_tag(planning_level))
+    os.makedirs(level_dir, exist_ok=True)
+    base_name = f"sprint_{sprint}"
+
+    metrics = sprint_metrics(sprint_df)
+    metrics_df = pd.DataFrame({
+        'Metric': ['Total Estimated', 'Completed', 'Remaining', 'Progress'],
+        'Value': [f"{metrics['Total Estimated']:,.1f}h", f"{metrics['Completed']:,.1f}h",
+                  f"{metrics['Remaining']:,.1f}h", f"{metrics['Progress']:.1f}%"]
+    })
+    task_list = sprint_task_list(sprint_df)
+
+    body = "\n".join([
+        "<h2>Summary</h2>", _table(metrics_df),
+        "<h2>Status Breakdown</h2>", _table(sprint_status_breakdown(sprint_df)),
+        "<h2>Contractor Group Breakdown</h2>", _table(sprint_contractor_breakdown(sprint_df)),
+        f"<h2>Detailed Task List ({len(task_list)} tasks)</h2>", _table(task_list),
+    ])
+    title = html.escape(f"{sprint_name(sprint)} Report - {planning_level}")
+    with open(os.path.join(level_dir, base_name + ".html"), "w", encoding="utf-8") as f:
+        f.write(PAGE_TEMPLATE.format(title=title, body=body))
+    with open(os.path.join(level_dir, base_name + ".csv"), "wb") as f:
+        f.write(export_csv(task_list).getbuffer())
+
+    return planning_level, sprint, len(task_list), f"{level_tag(planning_level)}/{base_name}.html"
+
+
+def _jobs(df, membership, out_dir):
+    df = df[df['Sprint Key'] != NO_SPRINT_KEY]
+    for sprint, sprint_df in df.groupby('Sprint Key'):
+        yield ALL_LEVELS, sprint, sprint_df, out_dir
+    # A task under several planning levels is reported under each of them
+    membership = membership.loc[df.index]
+    for planning_level in membership.columns:
+        for sprint, sprint_df in df[membership[planning_level]].groupby('Sprint Key'):
+            yield planning_level, sprint, sprint_df, out_dir
+
+
+def write_index(results, out_dir):
+    sections = []
+    levels = sorted({r[0] for r in results}, key=lambda pl: (pl != ALL_LEVELS, pl))
+    for planning_level in levels:
+        rows = sorted((r for r in results if r[0] == planning_level), key=lambda r: r[1], reverse=True)
+        links = "\n".join(
+            f'<li><a href="{html.escape(path)}">{sprint_name(sprint)}</a> ({count} tasks)</li>'
+            for _, sprint, count, path in rows
+        )
+        sections.append(f"<h2>{html.escape(planning_level)}</h2>\n<ul>\n{links}\n</ul>")
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(PAGE_TEMPLATE.format(title="Sprint Reports", body="\n".join(sections)))
+
+
+def generate_all_reports(df=None, out_dir=REPORT_DIR, workers=None, membership=None):
+    if df is None:
+        df, membership = load_tasks()
+    elif membership is None:
+        membership = level_membership(df)
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Each job carries only its own sprint slice, so workers never need the full frame
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(render_sprint_report, _jobs(df, membership, out_dir), chunksize=8))
+
+    write_index(results, out_dir)
+    print(f"[SUCCESS] Wrote {len(results)} sprint reports to {out_dir}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every sprint report to static HTML/CSV")
+    parser.add_argument("--data", default=DATA_FILE, help="Merged VersionOne export (data/task_quicklist.csv or task_quicklist.xlsx)")
+    parser.add_argument("--contractors", default=CONTRACTOR_PATH, help="Contractor File.xlsx")
+    parser.add_argument("--out", default=REPORT_DIR, help="Output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    print(f"[INFO] Loading {args.data}")
+    df, membership = load_tasks(args.data, args.contractors)
+    generate_all_reports(df, args.out, args.workers, membership)
+
+
+if __name__ == "__main__":
+    main()
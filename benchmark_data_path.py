@@ -0,0 +1,188 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+import pandas as pd
+from dashboard_data import (read_contractor_file, process_tasks, build_sprint_dimension, summarize_contractors,
+                            sum_by_sprint, sprint_metrics, sprint_status_breakdown, sprint_contractor_breakdown,
+                            sprint_task_list, project_hours_summary, contractor_performance, backlog_tasks,
+                            PROJECT_COLS, SPRINT_REPORT_COLS)
+from playwright_advanced import merge_tasklists
+from report_export import export_csv, export_sprint_pack
+from synthetic_data import BASE_ROWS, write_synthetic_exports
+
+# Times and memory-profiles each stage of the scrape -> dashboard data path on synthetic exports
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILE = os.path.join(BASE_DIR, "logs", "benchmark_results.jsonl")
+REGRESSION_THRESHOLD = 1.2
+
+
+def _quiet(func, *args):
+    # merge_tasklists prints a debug line per file and planning level
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def build_stages(work_dir, file_paths, contractor_path):
+    merged_path = os.path.join(work_dir, "task_quicklist.xlsx")
+    state = {}
+
+    def merge():
+        _quiet(merge_tasklists, file_paths, merged_path)
+
+    def read_merged():
+        state['raw'] = pd.read_excel(merged_path, engine="openpyxl")
+
+    def read_contractors():
+        state['contractors'] = read_contractor_file(contractor_path)
+
+    def process():
+        state['df'] = process_tasks(state['raw'].copy(), state['contractors'])
+
+    def sprint_dimension():
+        state['dim'] = build_sprint_dimension(state['df'])
+
+    def latest_sprint():
+        return state['df'][state['df']['Sprint Key'] == state['dim'].index[-1]]
+
+    def dashboard_tab():
+        df = state['df']
+        sum_by_sprint(df, ['Completed Hours', 'To Do'], state['dim'])
+        df.groupby('Contractor Group')[['Completed Hours', 'To Do']].sum()
+
+    def sprint_report_tab():
+        sprint_df = latest_sprint()
+        sprint_metrics(sprint_df)
+        sprint_status_breakdown(sprint_df)
+        sprint_contractor_breakdown(sprint_df)
+        sprint_task_list(sprint_df)
+
+    def project_tracking_tab():
+        project_hours_summary(state['df'])
+        sum_by_sprint(state['df'], PROJECT_COLS, state['dim'])
+
+    def contractor_tab():
+        summarize_contractors(state['df'], state['contractors'])
+
+    def analytics_tab():
+        df = state['df']
+        sum_by_sprint(df, ['Completed Hours'], state['dim'])
+        df.groupby('Status').size()
+        df.nlargest(10, 'Est. Hours')
+        contractor_performance(df)
+
+    def backlog_tab():
+        backlog_tasks(state['df'])
+
+    def csv_export():
+        export_csv(sprint_task_list(state['df']))
+
+    def sprint_pack_export():
+        export_sprint_pack(latest_sprint(), PROJECT_COLS, SPRINT_REPORT_COLS)
+
+    # Order matters: later stages read what earlier ones left in state
+    return [
+        ("merge_tasklists", merge),
+        ("read_merged_xlsx", read_merged),
+        ("read_contractor_file", read_contractors),
+        ("process_tasks", process),
+        ("build_sprint_dimension", sprint_dimension),
+        ("tab_dashboard", dashboard_tab),
+        ("tab_sprint_report", sprint_report_tab),
+        ("tab_project_tracking", project_tracking_tab),
+        ("tab_contractor_accountability", contractor_tab),
+        ("tab_analytics", analytics_tab),
+        ("tab_backlog", backlog_tab),
+        ("export_csv", csv_export),
+        ("export_sprint_pack", sprint_pack_export),
+    ]
+
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    # Separate pass for memory: tracemalloc itself slows allocation-heavy code down
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024 / 1024
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def previous_results(results_file):
+    latest = {}
+    if os.path.exists(results_file):
+        with open(results_file, encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                latest[(record["scale"], record["stage"])] = record
+    return latest
+
+
+def run_benchmarks(scales, repeat=3, results_file=RESULTS_FILE, seed=0):
+    baseline = previous_results(results_file)
+    revision = git_revision()
+    run_at = datetime.now().isoformat(timespec="seconds")
+    records = []
+
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as work_dir:
+            print(f"\n[INFO] Generating {BASE_ROWS * scale:,} synthetic rows (scale {scale}x)")
+            file_paths, contractor_path = write_synthetic_exports(work_dir, scale, seed)
+
+            print(f"{'stage':<32}{'median s':>10}{'peak MB':>10}  vs last")
+            for stage, func in build_stages(work_dir, file_paths, contractor_path):
+                seconds, peak_mb = measure(func, repeat)
+                record = {"run_at": run_at, "revision": revision, "scale": scale, "rows": BASE_ROWS * scale,
+                          "stage": stage, "seconds": round(seconds, 5), "peak_mb": round(peak_mb, 2)}
+                records.append(record)
+
+                previous = baseline.get((scale, stage))
+                change = ""
+                if previous and previous["seconds"] > 0:
+                    ratio = seconds / previous["seconds"]
+                    change = f"{ratio:.2f}x ({previous['revision']})"
+                    if ratio > REGRESSION_THRESHOLD:
+                        change += "  REGRESSION"
+                print(f"{stage:<32}{seconds:>10.4f}{peak_mb:>10.1f}  {change}")
+
+    os.makedirs(os.path.dirname(results_file) or ".", exist_ok=True)
+    with open(results_file, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    print(f"\n[SUCCESS] Appended {len(records)} results to {results_file}")
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the VersionOne data path on synthetic exports")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help=f"Multiples of {BASE_ROWS:,} rows (100x spends most of its time in xlsx I/O)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; the median is reported")
+    parser.add_argument("--results", default=RESULTS_FILE, help="JSON-lines file results are appended to")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run_benchmarks(args.scales, args.repeat, args.results, args.seed)
+
+
+if __name__ == "__main__":
+    main()
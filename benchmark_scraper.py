@@ -0,0 +1,99 @@
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import tempfile
+import time
+from mock_versionone import DEFAULT_LEVEL, MockVersionOne
+from playwright_advanced import PLANNING_LEVELS, run_playwright
+
+# Runs run_playwright end-to-end against mock_versionone.py and breaks each run into steps
+# using the order in which the mock served pages and exports
+
+
+def step_timings(events, start, end):
+    # Each step is the time between consecutive requests the mock saw; a failed level's time lands in the next step
+    steps = {}
+    last_t = start
+    for e in events:
+        if e["event"] == "page":
+            name = "launch_and_goto"
+        elif e["event"] == "apply":
+            name = f"{'reset' if e['level'] == DEFAULT_LEVEL else e['level']}: select_and_apply"
+        elif e["event"] in ("export", "export_failed"):
+            name = f"{e['level']}: export"
+        else:
+            continue
+        steps[name] = steps.get(name, 0.0) + e["t"] - last_t
+        last_t = e["t"]
+    steps["close_and_merge"] = end - last_t
+    return steps
+
+
+def run_once(mock, executable_path, quiet=True):
+    with tempfile.TemporaryDirectory() as download_dir:
+        start = time.perf_counter()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+            # Injected failures are captured into the temp dir, not logs/artifacts
+            run_playwright(url=mock.url, download_dir=download_dir, executable_path=executable_path,
+                           store_dir=os.path.join(download_dir, "artifacts"))
+        end = time.perf_counter()
+        exported = sorted(f for f in os.listdir(download_dir) if f.startswith("tasklist_"))
+        errors = [line for line in output.getvalue().splitlines() if line.startswith("[ERROR]")]
+    return {
+        "total": end - start,
+        "steps": step_timings(mock.events_since(start), start, end),
+        "exported": exported,
+        "errors": errors,
+    }
+
+
+def summarize(runs):
+    print(f"\n{'step':<40}{'mean s':>9}{'p50 s':>9}{'max s':>9}")
+    names = []
+    for run in runs:
+        names += [n for n in run["steps"] if n not in names]
+    for name in names + ["total"]:
+        values = [run["total"] if name == "total" else run["steps"][name] for run in runs
+                  if name == "total" or name in run["steps"]]
+        print(f"{name:<40}{statistics.mean(values):>9.2f}{statistics.median(values):>9.2f}{max(values):>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time run_playwright against the local VersionOne mock")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--scale", type=int, default=1, help="Synthetic export size (multiples of 10k rows)")
+    parser.add_argument("--chromium", default=None, help="Chromium executable (default: Playwright's bundled build)")
+    parser.add_argument("--page-latency", type=float, default=0.0)
+    parser.add_argument("--export-latency", type=float, default=0.0)
+    parser.add_argument("--apply-delay", type=float, default=0.0)
+    parser.add_argument("--page-fail-rate", type=float, default=0.0)
+    parser.add_argument("--export-fail-rate", type=float, default=0.0)
+    parser.add_argument("--missing-level", action="append", default=[])
+    parser.add_argument("--no-apply-level", action="append", default=[])
+    parser.add_argument("--verbose", action="store_true", help="Show the scraper's own output")
+    args = parser.parse_args()
+
+    mock = MockVersionOne(PLANNING_LEVELS, scale=args.scale, page_latency=args.page_latency,
+                          export_latency=args.export_latency, apply_delay=args.apply_delay,
+                          page_fail_rate=args.page_fail_rate, export_fail_rate=args.export_fail_rate,
+                          missing_levels=args.missing_level, no_apply_levels=args.no_apply_level)
+    print(f"[INFO] Mock VersionOne at {mock.start()}")
+    runs = []
+    try:
+        for i in range(args.runs):
+            run = run_once(mock, args.chromium, quiet=not args.verbose)
+            runs.append(run)
+            print(f"[INFO] Run {i + 1}/{args.runs}: {run['total']:.1f}s, "
+                  f"{len(run['exported'])} exports, {len(run['errors'])} errors")
+            for line in run["errors"]:
+                print(f"    {line}")
+    finally:
+        mock.stop()
+    summarize(runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import numpy as np
+import pandas as pd
+
+CONTRACTOR_FILE = "Contractor File.xlsx"
+# Sorted CSV copy of the merged export, written by merge_tasklists and published by auto_push.py
+PUBLISHED_CSV = "data/task_quicklist.csv"
+PROJECT_COLS = ['CDAS - 6441', 'EDS-4834', 'EEB-9372', 'UAP-SPM-9442', 'UAP-IV-9443', 'UAPSAL-9402']
+SPRINT_REPORT_COLS = ['Title', 'ID', 'Owner', 'Contractor Group', 'Status', 'Est. Hours', 'Completed Hours', 'To Do', 'Progress %'] + PROJECT_COLS
+# Optional timebox columns; the sprint dimension carries date ranges when an export includes them
+SPRINT_START_COL = 'Sprint Begin Date'
+SPRINT_END_COL = 'Sprint End Date'
+NO_SPRINT_KEY = -1
+# A task exported under several planning levels is stored once, with its levels joined in 'Planning Level'
+LEVEL_SEPARATOR = "; "
+
+# Shared by app.py and the headless report tools, so nothing in here may import streamlit
+
+
+def read_task_export(source):
+    # The published CSV parses ~80x faster than the xlsx and gives the same frame; uploads are always xlsx
+    if isinstance(source, str) and source.endswith(".arrow"):
+        from arrow_handoff import read_frame
+        return read_frame(source)
+    if isinstance(source, str) and source.endswith(".csv"):
+        return pd.read_csv(source)
+    return pd.read_excel(source, engine="openpyxl")
+
+
+def index_tasks(frame):
+    # Collapses the copies of a task that appear once per planning-level export into the first copy,
+    # with every level it appeared under in 'Planning Level'. Tasks without an ID are kept as they are,
+    # and an already indexed frame comes back unchanged
+    if 'ID' not in frame.columns or 'Planning Level' not in frame.columns:
+        return frame
+    shared = frame['ID'].notna() & frame.duplicated('ID', keep=False)
+    if not shared.any():
+        return frame
+    levels = (frame.loc[shared, ['ID', 'Planning Level']].dropna().drop_duplicates()
+              .sort_values('Planning Level').groupby('ID')['Planning Level'].agg(LEVEL_SEPARATOR.join))
+    tasks = frame[~(shared & frame.duplicated('ID'))].copy()
+    in_several = tasks['ID'].isin(levels.index)
+    tasks.loc[in_several, 'Planning Level'] = tasks.loc[in_several, 'ID'].map(levels)
+    return tasks.reset_index(drop=True)
+
+
+def level_membership(df):
+    # Task -> planning level table aligned with df: one bool column per level, so per-level views and
+    # totals need no duplicated task rows. process_task_levels builds it once per dataset; use that
+    # rather than calling this on every filter
+    if 'Planning Level' not in df.columns:
+        return pd.DataFrame(index=df.index)
+    return df['Planning Level'].astype('string').str.get_dummies(sep=LEVEL_SEPARATOR).astype(bool)
+
+
+def read_contractor_file(path=CONTRACTOR_FILE):
+    df = pd.read_excel(path)
+    # Map old column names to new ones if needed
+    rename_map = {'CDAS-6441': 'CDAS - 6441'}
+    df = df.rename(columns=rename_map)
+    df = df[['Contractor Group', 'Names'] + PROJECT_COLS].copy()
+    df.columns = ['Contractor Group', 'Owner'] + PROJECT_COLS
+    df['Owner'] = df['Owner'].astype(str).str.strip()
+    return df
+
+
+def encode_sprints(raw_sprints):
+    # Parse each distinct label once instead of running the regex over every row
+    codes, labels = pd.factorize(raw_sprints.astype(str))
+    numbers = pd.Series(labels).str.extract(r'(\d+)')[0].astype(float)
+    # int32 holds year- or ID-style sprint numbers; anything larger would wrap silently in astype, so those
+    # labels are treated as having no sprint rather than failing the whole dataset
+    too_large = numbers > np.iinfo('int32').max
+    if too_large.any():
+        print(f"[WARN] Sprint number out of range, treated as no sprint: "
+              f"{', '.join(repr(label) for label in labels[too_large.to_numpy()])}")
+        numbers = numbers.mask(too_large)
+    sprint = pd.Series(numbers.to_numpy()[codes], index=raw_sprints.index)
+    sprint_key = sprint.fillna(NO_SPRINT_KEY).astype('int32')
+    sprint_label = pd.Series(pd.Categorical.from_codes(codes, labels), index=raw_sprints.index)
+    return sprint, sprint_key, sprint_label
+
+
+def build_sprint_dimension(df):
+    # One row per sprint, indexed by Sprint Key in sprint order; tabs filter and group on the key
+    facts = df[df['Sprint Key'] != NO_SPRINT_KEY]
+    grouped = facts.groupby('Sprint Key', sort=True)
+    dim = pd.DataFrame({
+        'Sprint': grouped['Sprint'].first(),
+        'Sprint Labels': grouped['Sprint Label'].agg(lambda labels: ', '.join(sorted(labels.astype(str).unique()))),
+        'Task Count': grouped.size()
+    })
+    if SPRINT_START_COL in facts.columns:
+        dim['Start Date'] = pd.to_datetime(facts[SPRINT_START_COL], errors='coerce').groupby(facts['Sprint Key']).min()
+    if SPRINT_END_COL in facts.columns:
+        dim['End Date'] = pd.to_datetime(facts[SPRINT_END_COL], errors='coerce').groupby(facts['Sprint Key']).max()
+    dim['Sort Order'] = range(len(dim))
+    return dim
+
+
+def sprint_name(sprint_key):
+    return f"Sprint {sprint_key}"
+
+
+def sum_by_sprint(df, value_cols, sprint_dim):
+    # Integer groupby on the sprint key, then join the sprint number back from the dimension
+    summary = df.groupby('Sprint Key')[value_cols].sum()
+    return sprint_dim[['Sprint']].join(summary, how='inner').reset_index(drop=True)
+
+
+def process_tasks(uploaded_df, contractor_df):
+    return process_task_levels(uploaded_df, contractor_df)[0]
+
+
+def process_task_levels(uploaded_df, contractor_df):
+    # process_tasks plus the level_membership table it builds on the way (same index), so callers that
+    # filter by planning level do not split 'Planning Level' again.
+    # Exports merged before index_tasks existed (and uploads) still carry one row per planning level
+    uploaded_df = index_tasks(uploaded_df)
+    uploaded_df['Owner'] = uploaded_df['Owner'].astype(str).str.strip()
+    uploaded_df['Status'] = uploaded_df['Status'].astype(str).fillna('Unknown')
+    uploaded_df['Sprint'], uploaded_df['Sprint Key'], uploaded_df['Sprint Label'] = encode_sprints(uploaded_df['Sprint'])
+    uploaded_df['Backlog'] = uploaded_df['Backlog'].astype(str).fillna('')
+    uploaded_df['Est. Hours'] = pd.to_numeric(uploaded_df['Est. Hours'], errors='coerce').fillna(0)
+    uploaded_df['To Do'] = pd.to_numeric(uploaded_df['To Do'], errors='coerce').fillna(0)
+
+    uploaded_df = uploaded_df.merge(contractor_df[['Owner', 'Contractor Group']], on='Owner', how='left')
+    uploaded_df['Contractor Group'] = uploaded_df['Contractor Group'].fillna('Unknown')
+
+    # Calculate Completed Hours FIRST
+    uploaded_df['Completed Hours'] = uploaded_df['Est. Hours'] - uploaded_df['To Do']
+
+    # Now populate project columns - preserve existing values or derive from Planning Level
+    membership = level_membership(uploaded_df)
+    for col in PROJECT_COLS:
+        # A task under several planning levels counts its completed hours toward each of those projects
+        in_level = membership[col] if col in membership.columns else False
+        level_hours = uploaded_df['Completed Hours'].where(in_level, 0.0)
+        if col in uploaded_df.columns:
+            # Preserve existing project hours, but fill missing with Planning Level logic
+            existing = pd.to_numeric(uploaded_df[col], errors='coerce')
+            uploaded_df[col] = existing.mask(existing.isna() | (existing == 0), level_hours)
+        else:
+            # Column doesn't exist - derive from Planning Level
+            uploaded_df[col] = level_hours
+    uploaded_df['Level Count'] = membership.sum(axis=1).clip(lower=1).astype('int8')
+
+    uploaded_df['Progress %'] = ((uploaded_df['Completed Hours'] / uploaded_df['Est. Hours']) * 100).fillna(0).round(1)
+    uploaded_df['Total Project Hours'] = uploaded_df[PROJECT_COLS].sum(axis=1)
+
+    return uploaded_df, membership
+
+
+def hour_totals(df, value_cols, per_level=False):
+    # Each task counts once; per_level counts it once per planning level it is under, which is what the
+    # old one-row-per-level export summed to
+    values = df[value_cols]
+    if per_level:
+        values = values.mul(df['Level Count'], axis=0)
+    return values.sum()
+
+
+def summarize_contractors(df, contractor_df):
+    hours_by_owner = df.groupby('Owner').agg({
+        'Est. Hours': 'sum',
+        'Completed Hours': 'sum',
+        'To Do': 'sum',
+        'Title': 'count'
+    }).reset_index()
+    hours_by_owner.columns = ['Owner', 'Est. Hours', 'Completed Hours', 'To Do', 'Task Count']
+
+    all_contractors = contractor_df[['Owner', 'Contractor Group']].copy()
+    all_contractors = all_contractors.merge(hours_by_owner, on='Owner', how='left')
+    all_contractors = all_contractors.fillna(0)
+
+    # Round hour columns to 1 decimal place and Task Count to integer
+    all_contractors['Est. Hours'] = all_contractors['Est. Hours'].round(1)
+    all_contractors['Completed Hours'] = all_contractors['Completed Hours'].round(1)
+    all_contractors['To Do'] = all_contractors['To Do'].round(1)
+    all_contractors['Task Count'] = all_contractors['Task Count'].astype(int)
+
+    return all_contractors
+
+
+# --- Sprint Report aggregations ---
+
+def sprint_metrics(sprint_df):
+    est = sprint_df['Est. Hours'].sum()
+    completed = sprint_df['Completed Hours'].sum()
+    remaining = sprint_df['To Do'].sum()
+    progress = (completed / est * 100) if est > 0 else 0
+    return {'Total Estimated': est, 'Completed': completed, 'Remaining': remaining, 'Progress': progress}
+
+
+def sprint_status_breakdown(sprint_df):
+    return sprint_df.groupby('Status')['Est. Hours'].sum().reset_index()
+
+
+def sprint_contractor_breakdown(sprint_df):
+    return sprint_df.groupby('Contractor Group').agg({
+        'Est. Hours': 'sum',
+        'Completed Hours': 'sum',
+        'To Do': 'sum'
+    }).reset_index().sort_values('Est. Hours', ascending=False)
+
+
+def sprint_task_list(sprint_df):
+    return sprint_df[SPRINT_REPORT_COLS].sort_values('Contractor Group')
+
+
+# --- Project Tracking / Analytics / Backlog aggregations ---
+
+def project_hours_summary(df):
+    project_summary = df[PROJECT_COLS].sum().reset_index()
+    project_summary.columns = ['Project', 'Hours']
+    return project_summary[project_summary['Hours'] > 0].sort_values('Hours', ascending=False)
+
+
+def contractor_performance(df):
+    contractor_perf = df.groupby('Contractor Group').agg({
+        'Title': 'count',
+        'Est. Hours': 'sum',
+        'Completed Hours': 'sum',
+        'To Do': 'sum',
+        'Total Project Hours': 'sum'
+    }).reset_index()
+    contractor_perf.columns = ['Contractor Group', 'Task Count', 'Total Est. Hours',
+                               'Completed Hours', 'Remaining Hours', 'Project Hours']
+    contractor_perf['Completion Rate %'] = ((contractor_perf['Completed Hours'] /
+                                             contractor_perf['Total Est. Hours']) * 100).round(1)
+    return contractor_perf.sort_values('Completed Hours', ascending=False)
+
+
+def backlog_tasks(df):
+    return df[df['Backlog'].notna() & (df['Backlog'].str.strip() != '')]
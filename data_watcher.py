@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+# One per dashboard server process (app.py holds it in st.cache_resource). A background thread polls
+# the data source's version. When the version changes, the thread loads and processes the new dataset
+# once and swaps it in, and every session then reads that shared snapshot. Sessions only compare
+# versions, so a refresh costs one load per process rather than one per open tab.
+# The first load also runs on the thread, so creating the watcher returns at once and the page can
+# paint while the data warms up; `ready` is set once that first load has finished (or failed).
+# A version that fails to load is not re-read on every poll: it is retried with exponential backoff
+# (up to FAILED_RETRY_MAX_SECONDS), while a new version is tried at once.
+WATCH_SECONDS = 5
+FAILED_RETRY_MAX_SECONDS = 10 * 60
+
+Snapshot = namedtuple("Snapshot", ["source", "version", "scraped_at", "loaded_at", "tasks", "sprint_dim", "levels",
+                                   "load_seconds"])
+
+
+class DatasetWatcher:
+    def __init__(self, resolve_source, load, interval=WATCH_SECONDS):
+        # resolve_source() -> (path, version, scraped_at) or (None, None, None);
+        # load(path) -> (tasks, sprint_dim, levels, load_seconds), load_seconds being {step: seconds}
+        self.resolve_source = resolve_source
+        self.load = load
+        self.interval = interval
+        self.snapshot = None
+        self.error = None
+        self.ready = threading.Event()
+        self.ready_at = None
+        self.failed_version = None
+        self.failures = 0
+        self.retry_at = 0
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name="dataset-watcher", daemon=True).start()
+
+    def refresh(self):
+        with self._lock:
+            path, version, scraped_at = self.resolve_source()
+            if path is None or (self.snapshot and self.snapshot.version == version):
+                return self.snapshot
+            if version == self.failed_version and time.monotonic() < self.retry_at:
+                return self.snapshot
+            try:
+                tasks, sprint_dim, levels, load_seconds = self.load(path)
+            except Exception as e:
+                # Keep serving the previous snapshot. A half-written source gets a new version once the
+                # writer finishes; a broken one (bad contractor file, corrupt export) waits out the backoff
+                self.error = f"{path}: {e}"
+                self.failures = self.failures + 1 if version == self.failed_version else 1
+                self.failed_version = version
+                self.retry_at = time.monotonic() + min(FAILED_RETRY_MAX_SECONDS, self.interval * 2 ** self.failures)
+                return self.snapshot
+            self.snapshot = Snapshot(path, version, scraped_at, datetime.now(), tasks, sprint_dim, levels,
+                                     load_seconds)
+            self.error = None
+            self.failed_version = None
+            self.failures = 0
+            return self.snapshot
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                self.error = str(e)
+            if not self.ready.is_set():
+                self.ready_at = time.perf_counter()
+                self.ready.set()
+            time.sleep(self.interval)
@@ -0,0 +1,377 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import datetime
+from playwright_advanced import merge_tasklists
+from run_metrics import percentile
+from synthetic_data import BASE_ROWS, write_synthetic_exports
+
+# Headless load test for app.py. It serves the dashboard with `streamlit run` on synthetic exports,
+# published the way the scraper publishes them. Then N sessions connect at once over Streamlit's
+# websocket protocol, like the team opening the dashboard after the morning refresh. Each session
+# waits for the data, then changes the sprint/level filters, sort orders and table pages. Rerun
+# latency is measured from sending the widget change to receiving the last element of the rerun,
+# which is what a browser waits for. The server process's memory and CPU are sampled throughout.
+# Like the browser, a session honours `auto_rerun` messages: while it waits it reruns each run_every
+# fragment on its timer (the data-status footer), and follows the app rerun the footer triggers once
+# the data has warmed up or been republished, so --refresh-at reaches the sessions the same way.
+# Tab switches happen in the browser and never rerun the script: every rerun renders all tabs.
+# Results are appended to logs/load_test.jsonl. Install requirements-dev.txt first (websockets, psutil).
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_FILE = os.path.join(BASE_DIR, "app.py")
+RESULTS_FILE = os.path.join(BASE_DIR, "logs", "load_test.jsonl")
+SERVER_START_TIMEOUT = 60
+SESSION_TIMEOUT = 300
+WARMUP_POLL_SECONDS = 1
+SAMPLE_SECONDS = 0.5
+# Filter widgets a session may change, by label; the Add/Edit Hours form is left alone
+FILTER_WIDGETS = {
+    "selectbox": {"Select Sprint", "Filter by Planning Level", "Select Sprint for Report", "Filter by Sprint",
+                  "Select Project to View Details", "Sort by", "Rows per page"},
+    "radio": {"View Mode", "Order", "Count tasks under several planning levels"},
+    "multiselect": {"Sprint", "Owner", "Status", "Contractor Group", "Project (has hours)",
+                    "Filter by Contractor Group"},
+    "checkbox": {"Show only inactive contractors"},
+    # Matched as a prefix: the table pagers are labelled "Page (of N)"
+    "number_input": {"Page (of"},
+}
+
+
+def publish_synthetic_data(work_dir, scale, source, seed=0):
+    # Lays work_dir out like the dashboard checkout: Contractor File.xlsx plus the merged data in the
+    # form app.py prefers for `source`
+    file_paths, _ = write_synthetic_exports(work_dir, scale, seed)
+    csv_path = os.path.join(work_dir, "data", "task_quicklist.csv") if source == "csv" else None
+    handoff_dir = os.path.join(work_dir, "handoff") if source == "arrow" else None
+    if csv_path:
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+
+    def publish():
+        # merge_tasklists prints a debug line per file and planning level
+        with contextlib.redirect_stdout(io.StringIO()):
+            merge_tasklists(file_paths, os.path.join(work_dir, "task_quicklist.xlsx"), csv_path, handoff_dir)
+    publish()
+    return publish
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def start_server(work_dir, port, log_file):
+    # app.py resolves its data files relative to the working directory
+    server = subprocess.Popen([sys.executable, "-m", "streamlit", "run", APP_FILE, "--server.headless", "true",
+                               "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+                              cwd=work_dir, stdout=log_file, stderr=subprocess.STDOUT)
+    deadline = time.time() + SERVER_START_TIMEOUT
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=2) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError(f"streamlit did not answer on port {port} within {SERVER_START_TIMEOUT}s")
+
+
+def process_usage(pid):
+    # (resident MB, CPU seconds) of the server process, or (None, None) without psutil or /proc (Windows)
+    try:
+        import psutil
+        process = psutil.Process(pid)
+        cpu = process.cpu_times()
+        return process.memory_info().rss / 1024 / 1024, cpu.user + cpu.system
+    except ImportError:
+        pass
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return rss, (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, AttributeError, ValueError):
+        return None, None
+
+
+class ResourceSampler:
+    def __init__(self, pid, interval=SAMPLE_SECONDS):
+        self.pid = pid
+        self.interval = interval
+        self.peak_rss_mb = None
+        self.peak_cpu_pct = None
+        self.mean_cpu_pct = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="load-test-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        start_wall, (_, start_cpu) = time.perf_counter(), process_usage(self.pid)
+        wall, cpu = start_wall, start_cpu
+        while not self._stop.wait(self.interval):
+            now_wall, (rss, now_cpu) = time.perf_counter(), process_usage(self.pid)
+            if rss is None:
+                return
+            self.peak_rss_mb = max(self.peak_rss_mb or 0.0, rss)
+            # Percent of one core; pandas and pyarrow release the GIL, so it can pass 100
+            self.peak_cpu_pct = max(self.peak_cpu_pct or 0.0, (now_cpu - cpu) / (now_wall - wall) * 100)
+            self.mean_cpu_pct = (now_cpu - start_cpu) / (now_wall - start_wall) * 100
+            wall, cpu = now_wall, now_cpu
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+class DashboardSession:
+    # One browser tab: reruns the script with its current widget values and reads back what was rendered
+    def __init__(self, ws, rng):
+        self.ws = ws
+        self.rng = rng
+        self.widgets = {}
+        self.values = {}
+        self.has_data = False
+        self.exceptions = []
+        # run_every fragments registered by the last full run: fragment_id -> interval / next due time
+        self.fragment_intervals = {}
+        self.fragment_due = {}
+        self.last_run_full = False
+
+    async def rerun(self, fragment_id=None):
+        # With fragment_id only that fragment reruns, as on the browser's auto_rerun timer; the run turns
+        # into a full app run if the fragment calls st.rerun(scope="app")
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.widget_states.widgets.extend(self.values.values())
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+            msg.rerun_script.is_auto_rerun = True
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+
+        widgets, has_data, exceptions, intervals, full_run = {}, False, [], {}, False
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(await asyncio.wait_for(self.ws.recv(), SESSION_TIMEOUT))
+            kind = reply.WhichOneof("type")
+            if kind == "new_session" and not reply.new_session.fragment_ids_this_run:
+                full_run = True
+                widgets, has_data, intervals = {}, False, {}
+                continue
+            if kind == "auto_rerun":
+                intervals[reply.auto_rerun.fragment_id] = reply.auto_rerun.interval
+                continue
+            if kind == "script_finished":
+                # A fragment that reruns the app finishes early; the full run follows on the same stream
+                if reply.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    break
+                continue
+            if kind != "delta" or reply.delta.WhichOneof("type") != "new_element":
+                continue
+            element_type = reply.delta.new_element.WhichOneof("type")
+            proto = getattr(reply.delta.new_element, element_type)
+            if element_type == "metric":
+                has_data = True
+            elif element_type == "exception":
+                exceptions.append(f"{proto.type}: {proto.message}")
+            elif proto_is_filter(element_type, proto):
+                widgets[proto.id] = (element_type, proto)
+        seconds = time.perf_counter() - start
+
+        self.exceptions, self.last_run_full = exceptions, full_run
+        if full_run:
+            # Like the browser, only send values for widgets that are still on the page, and restart the
+            # fragment timers the run registered
+            self.widgets, self.has_data = widgets, has_data
+            self.values = {wid: value for wid, value in self.values.items() if wid in widgets}
+            self.fragment_intervals = intervals
+            self.fragment_due = {fid: time.perf_counter() + interval for fid, interval in intervals.items()}
+        return seconds
+
+    async def idle(self, seconds, record):
+        # Waits like an open tab: fragments whose timer falls due meanwhile are rerun, and
+        # record(seconds, step) is called for each of those runs
+        until = time.perf_counter() + seconds
+        while self.fragment_due:
+            fragment_id = min(self.fragment_due, key=self.fragment_due.get)
+            due = self.fragment_due[fragment_id]
+            if due > until:
+                break
+            await asyncio.sleep(max(0, due - time.perf_counter()))
+            self.fragment_due[fragment_id] = due + self.fragment_intervals[fragment_id]
+            seconds = await self.rerun(fragment_id)
+            record(seconds, "fragment -> app rerun" if self.last_run_full else "fragment rerun")
+        await asyncio.sleep(max(0, until - time.perf_counter()))
+
+    def change_filter(self):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        wid = self.rng.choice(sorted(self.widgets))
+        kind, proto = self.widgets[wid]
+        state = WidgetState(id=wid)
+        if kind == "checkbox":
+            previous = self.values.get(wid)
+            state.bool_value = not (previous.bool_value if previous else proto.default)
+        elif kind == "number_input":
+            state.double_value = self.rng.randint(int(proto.min), int(proto.max))
+        elif kind == "multiselect":
+            count = min(len(proto.options), self.rng.randint(0, 3))
+            state.string_array_value.data.extend(self.rng.sample(list(proto.options), count))
+        else:
+            state.string_value = self.rng.choice(proto.options)
+        self.values[wid] = state
+        return "table page" if kind == "number_input" else proto.label
+
+
+def proto_is_filter(element_type, proto):
+    if element_type not in FILTER_WIDGETS:
+        return False
+    if element_type == "number_input":
+        return any(proto.label.startswith(prefix) for prefix in FILTER_WIDGETS[element_type])
+    return proto.label in FILTER_WIDGETS[element_type]
+
+
+async def run_session(session_id, url, actions, think_seconds, samples, errors):
+    import websockets
+
+    rng = random.Random(session_id)
+    try:
+        async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+            session = DashboardSession(ws, rng)
+
+            def record(seconds, *steps):
+                samples.extend((step, seconds) for step in steps)
+                errors.extend(f"session {session_id} {steps[-1]}: {e}" for e in session.exceptions)
+
+            opened = time.perf_counter()
+            record(await session.rerun(), "first_paint")
+            # On a cold server the page paints before the data is ready; the footer fragment polls every
+            # WARMUP_POLL_SECONDS and reruns the app once it is
+            while not session.has_data:
+                if session.exceptions or not session.fragment_due or time.perf_counter() - opened > SESSION_TIMEOUT:
+                    errors.append(f"session {session_id}: no data after {time.perf_counter() - opened:.0f}s")
+                    return
+                await session.idle(WARMUP_POLL_SECONDS, record)
+            samples.append(("data_visible", time.perf_counter() - opened))
+
+            for _ in range(actions):
+                await session.idle(rng.uniform(0, think_seconds * 2), record)
+                label = session.change_filter()
+                record(await session.rerun(), "rerun", f"rerun: {label}")
+    except Exception as e:
+        errors.append(f"session {session_id}: {type(e).__name__}: {e}")
+
+
+async def run_sessions(url, users, actions, think_seconds, refresh_at, publish):
+    samples, errors = [], []
+    refresh = None
+    if refresh_at is not None:
+        loop = asyncio.get_running_loop()
+        refresh = loop.call_later(refresh_at, lambda: loop.run_in_executor(None, publish))
+    await asyncio.gather(*(run_session(i, url, actions, think_seconds, samples, errors) for i in range(users)))
+    if refresh:
+        refresh.cancel()
+    return samples, errors
+
+
+def latency_table(samples):
+    steps = {}
+    for step, seconds in samples:
+        steps.setdefault(step, []).append(seconds)
+    order = {"first_paint": 0, "data_visible": 1, "rerun": 2}
+    rows = []
+    for step, values in sorted(steps.items(), key=lambda s: (order.get(s[0], 3), s[0])):
+        rows.append({"step": step, "count": len(values), "p50": round(percentile(values, 50), 4),
+                     "p95": round(percentile(values, 95), 4), "p99": round(percentile(values, 99), 4),
+                     "max": round(max(values), 4)})
+    return rows
+
+
+def run_load_test(users=10, actions=20, think_seconds=1.0, scale=1, source="arrow", refresh_at=None,
+                  results_file=RESULTS_FILE, seed=0):
+    with tempfile.TemporaryDirectory() as work_dir:
+        print(f"[INFO] Publishing {BASE_ROWS * scale:,} synthetic rows as {source}")
+        publish = publish_synthetic_data(work_dir, scale, source, seed)
+
+        port = free_port()
+        with open(os.path.join(work_dir, "streamlit.log"), "wb") as log_file:
+            server = start_server(work_dir, port, log_file)
+            try:
+                sampler = ResourceSampler(server.pid)
+                sampler.start()
+                print(f"[INFO] {users} sessions x {actions} interactions (think time ~{think_seconds:g}s)")
+                started = time.perf_counter()
+                samples, errors = asyncio.run(run_sessions(f"ws://localhost:{port}/_stcore/stream", users,
+                                                           actions, think_seconds, refresh_at, publish))
+                wall_seconds = time.perf_counter() - started
+                sampler.stop()
+            finally:
+                server.terminate()
+                server.wait()
+
+    rows = latency_table(samples)
+    record = {"run_at": datetime.now().isoformat(timespec="seconds"), "users": users, "actions": actions,
+              "think_seconds": think_seconds, "rows": BASE_ROWS * scale, "source": source,
+              "refresh_at": refresh_at, "seconds": round(wall_seconds, 2),
+              "peak_rss_mb": sampler.peak_rss_mb and round(sampler.peak_rss_mb, 1),
+              "peak_cpu_pct": sampler.peak_cpu_pct and round(sampler.peak_cpu_pct, 1),
+              "mean_cpu_pct": sampler.mean_cpu_pct and round(sampler.mean_cpu_pct, 1),
+              "errors": len(errors), "latency": rows}
+
+    print(f"\n{'step':<40}{'count':>7}{'p50 s':>9}{'p95 s':>9}{'p99 s':>9}{'max s':>9}")
+    for row in rows:
+        print(f"{row['step']:<40}{row['count']:>7}{row['p50']:>9.3f}{row['p95']:>9.3f}{row['p99']:>9.3f}{row['max']:>9.3f}")
+    if record["peak_rss_mb"] is not None:
+        print(f"\n[INFO] Server peak memory {record['peak_rss_mb']:,.0f} MB | CPU peak {record['peak_cpu_pct']:.0f}%, "
+              f"mean {record['mean_cpu_pct']:.0f}% of one core | {wall_seconds:.1f}s wall")
+    else:
+        print(f"\n[INFO] Server memory/CPU not sampled (pip install psutil) | {wall_seconds:.1f}s wall")
+    for error in errors[:10]:
+        print(f"[ERROR] {error}")
+
+    os.makedirs(os.path.dirname(results_file), exist_ok=True)
+    with open(results_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    print(f"[SUCCESS] Appended results to {results_file}")
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the dashboard with concurrent headless sessions")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--actions", type=int, default=20, help="Filter changes per session")
+    parser.add_argument("--think", type=float, default=1.0, help="Mean seconds between a session's interactions")
+    parser.add_argument("--scale", type=int, default=1, help=f"Multiple of {BASE_ROWS:,} synthetic rows")
+    parser.add_argument("--source", choices=["arrow", "csv", "xlsx"], default="arrow",
+                        help="How the merged data is published (app.py prefers arrow, then csv, then xlsx)")
+    parser.add_argument("--refresh-at", type=float, default=None,
+                        help="Republish the data this many seconds in, so sessions switch to a new version mid-test")
+    parser.add_argument("--results", default=RESULTS_FILE, help="JSON-lines file results are appended to")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run_load_test(args.users, args.actions, args.think, args.scale, args.source, args.refresh_at,
+                  args.results, args.seed)
+
+
+if __name__ == "__main__":
+    main()
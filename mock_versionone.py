@@ -0,0 +1,216 @@
+import argparse
+import html
+import io
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from synthetic_data import BASE_ROWS, generate_tasks, write_xlsx
+
+# Local stand-in for the VersionOne TaskListPage: just enough DOM for run_playwright's selectors
+# (banner Dismiss, .new-project-selector, div.selector-modal, Apply, svg.wrench, "Export (.xlsx) New")
+
+DEFAULT_LEVEL = "CDAS - 6441"
+PAGE_PATH = "/v1/Default.aspx"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>TaskList - VersionOne (mock)</title>
+<style>
+.selector-modal {{ display: none; border: 1px solid #999; padding: 8px; }}
+.pl-option {{ cursor: pointer; padding: 2px; }}
+.action-buttons {{ display: none; }}
+#menu {{ display: none; border: 1px solid #999; }}
+svg.wrench {{ width: 16px; height: 16px; cursor: pointer; }}
+</style>
+</head>
+<body>
+<div id="banner">Scheduled maintenance this weekend <button onclick="this.parentNode.remove()">Dismiss</button></div>
+<h1>Task List: {current}</h1>
+<div class="new-project-selector" onclick="toggleModal()">{current} &#9662;</div>
+<div class="selector-modal" id="modal">
+  <div id="PlanningLevelFilters">
+    {options}
+    <div class="action-buttons" id="actions">
+      <button class="MuiButton-root MuiButtonBase-root" onclick="applyLevel()"><span>Apply</span></button>
+    </div>
+  </div>
+</div>
+<div class="grid-toolbar">
+  <svg class="wrench"><rect width="16" height="16"/></svg>
+  <svg class="wrench" onclick="toggleMenu()"><rect width="16" height="16"/></svg>
+</div>
+<div id="menu"><div class="menu-item" onclick="exportGrid()">Export (.xlsx) New</div></div>
+<script>
+var current = {current_json};
+var pending = null;
+var noApply = {no_apply_json};
+function toggleModal() {{
+  var modal = document.getElementById('modal');
+  modal.style.display = modal.style.display === 'block' ? 'none' : 'block';
+}}
+function pick(el) {{
+  pending = el.getAttribute('data-level');
+  document.getElementById('actions').style.display = noApply.indexOf(pending) >= 0 ? 'none' : 'block';
+}}
+function applyLevel() {{
+  document.getElementById('modal').style.display = 'none';
+  setTimeout(function () {{
+    window.location.href = '{page_path}?menu=TaskListPage&level=' + encodeURIComponent(pending);
+  }}, {apply_delay_ms});
+}}
+function toggleMenu() {{
+  var menu = document.getElementById('menu');
+  menu.style.display = menu.style.display === 'block' ? 'none' : 'block';
+}}
+function exportGrid() {{
+  document.getElementById('menu').style.display = 'none';
+  var a = document.createElement('a');
+  a.href = '/export?level=' + encodeURIComponent(current);
+  a.download = '';
+  document.body.appendChild(a);
+  a.click();
+  a.remove();
+}}
+</script>
+</body>
+</html>
+"""
+
+
+class MockVersionOne:
+    def __init__(self, levels, port=0, scale=1, seed=0, page_latency=0.0, export_latency=0.0, apply_delay=0.0,
+                 page_fail_rate=0.0, export_fail_rate=0.0, missing_levels=(), no_apply_levels=()):
+        self.levels = [DEFAULT_LEVEL] + [pl for pl in levels if pl != DEFAULT_LEVEL]
+        self.port = port
+        self.page_latency = page_latency
+        self.export_latency = export_latency
+        self.apply_delay = apply_delay
+        self.page_fail_rate = page_fail_rate
+        self.export_fail_rate = export_fail_rate
+        self.missing_levels = set(missing_levels)
+        self.no_apply_levels = set(no_apply_levels)
+        self.random = random.Random(seed)
+        self.events = []
+        self._lock = threading.Lock()
+        self._server = None
+
+        tasks = generate_tasks(BASE_ROWS * scale, seed=seed)
+        self.exports = {}
+        for level in self.levels:
+            buffer = io.BytesIO()
+            write_xlsx(tasks[tasks['Planning Level'] == level], buffer)
+            self.exports[level] = buffer.getvalue()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}{PAGE_PATH}?menu=TaskListPage"
+
+    def record(self, event, level=None, **detail):
+        with self._lock:
+            self.events.append({"t": time.perf_counter(), "event": event, "level": level, **detail})
+
+    def events_since(self, start):
+        with self._lock:
+            return [e for e in self.events if e["t"] >= start]
+
+    def should_fail(self, rate):
+        with self._lock:
+            return self.random.random() < rate
+
+    def render_page(self, current):
+        options = "\n    ".join(
+            f'<div class="pl-option" data-level="{html.escape(pl)}" onclick="pick(this)">{html.escape(pl)}</div>'
+            for pl in self.levels if pl not in self.missing_levels
+        )
+        return PAGE_TEMPLATE.format(
+            current=html.escape(current), current_json=json.dumps(current), options=options,
+            no_apply_json=json.dumps(sorted(self.no_apply_levels)), page_path=PAGE_PATH,
+            apply_delay_ms=int(self.apply_delay * 1000)
+        ).encode("utf-8")
+
+    def start(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def send_body(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                level = query.get("level", [None])[0]
+
+                if parsed.path == PAGE_PATH:
+                    time.sleep(mock.page_latency)
+                    if mock.should_fail(mock.page_fail_rate):
+                        mock.record("page_failed", level)
+                        self.send_body(503, b"Service Unavailable", "text/plain")
+                        return
+                    mock.record("apply" if level else "page", level or DEFAULT_LEVEL)
+                    self.send_body(200, mock.render_page(level or DEFAULT_LEVEL), "text/html; charset=utf-8")
+                elif parsed.path == "/export" and level in mock.exports:
+                    time.sleep(mock.export_latency)
+                    if mock.should_fail(mock.export_fail_rate):
+                        mock.record("export_failed", level)
+                        self.send_body(500, b"Export failed", "text/plain")
+                        return
+                    mock.record("export", level, bytes=len(mock.exports[level]))
+                    self.send_body(200, mock.exports[level], XLSX_MIME,
+                                   {"Content-Disposition": 'attachment; filename="TaskList.xlsx"'})
+                else:
+                    self.send_body(404, b"Not Found", "text/plain")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def main():
+    from playwright_advanced import PLANNING_LEVELS
+
+    parser = argparse.ArgumentParser(description="Serve a mock VersionOne TaskListPage for scraper testing")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--scale", type=int, default=1, help=f"Export size as a multiple of {BASE_ROWS:,} rows")
+    parser.add_argument("--page-latency", type=float, default=0.0, help="Seconds added to each page load")
+    parser.add_argument("--export-latency", type=float, default=0.0, help="Seconds added to each export")
+    parser.add_argument("--apply-delay", type=float, default=0.0, help="Seconds between Apply and the page reload")
+    parser.add_argument("--page-fail-rate", type=float, default=0.0, help="Probability a page load returns 503")
+    parser.add_argument("--export-fail-rate", type=float, default=0.0, help="Probability an export returns 500")
+    parser.add_argument("--missing-level", action="append", default=[], help="Leave this level out of the selector")
+    parser.add_argument("--no-apply-level", action="append", default=[], help="Never show Apply for this level")
+    args = parser.parse_args()
+
+    mock = MockVersionOne(PLANNING_LEVELS, port=args.port, scale=args.scale, page_latency=args.page_latency,
+                          export_latency=args.export_latency, apply_delay=args.apply_delay,
+                          page_fail_rate=args.page_fail_rate, export_fail_rate=args.export_fail_rate,
+                          missing_levels=args.missing_level, no_apply_levels=args.no_apply_level)
+    print(f"[INFO] Mock VersionOne serving {mock.start()}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
-from playwright.sync_api import sync_playwright
 import os
-from datetime import datetime
 import pandas as pd
+from run_metrics import span
+from dashboard_data import PUBLISHED_CSV, index_tasks
+from artifact_store import ARTIFACT_DIR, capture_failure
+from arrow_handoff import HANDOFF_DIR, publish_frame
 
 
 
@@ -9,6 +11,7 @@ DOWNLOAD_DIR = "C:/Users/tbh2j0/OneDrive - USPS/Test Folder/versionone_dashboard
 FINAL_OUTPUT = os.path.join(DOWNLOAD_DIR, "task_quicklist.xlsx")
 CHROMIUM_PATH = "C:/Users/tbh2j0/AppData/Local/ms-playwright/chromium-1187/chrome-win/chrome.exe"
 V1_URL = "https://versionone.usps.gov/v1/Default.aspx?menu=TaskListPage"
+DEFAULT_LEVEL = "CDAS - 6441"
 
 PLANNING_LEVELS = [
     "EDS-4834",
@@ -18,82 +21,105 @@ PLANNING_LEVELS = [
     "UAP-SPM-9442"
 ]
 
-def run_playwright():
+def level_file(download_dir, pl):
+    return os.path.join(download_dir, f"tasklist_{pl.replace(' ', '').replace('-', '')}.xlsx")
+
+def run_playwright(url=V1_URL, download_dir=DOWNLOAD_DIR, executable_path=CHROMIUM_PATH, planning_levels=None,
+                   store_dir=ARTIFACT_DIR):
+    # Imported here so merge_tasklists can be used (and benchmarked) without Playwright installed
+    from playwright.sync_api import sync_playwright
+
+    # url/download_dir/executable_path/store_dir are overridden by benchmark_scraper.py to run against
+    # mock_versionone.py without touching the real failure-artifact store.
+    # planning_levels limits the run to those levels (the scheduler retries only the ones that failed); the
+    # merge then uses the last good export on disk for every other level. Returns the levels that failed.
+    export_default = planning_levels is None or DEFAULT_LEVEL in planning_levels
+    levels = [pl for pl in (PLANNING_LEVELS if planning_levels is None else planning_levels) if pl != DEFAULT_LEVEL]
+    failed_levels = []
+
     with sync_playwright() as p:
-        browser = p.chromium.launch(executable_path=CHROMIUM_PATH, headless=True)
-        context = browser.new_context(accept_downloads=True)
-        page = context.new_page()
+        with span("browser_launch"):
+            browser = p.chromium.launch(executable_path=executable_path, headless=True)
+            context = browser.new_context(accept_downloads=True)
+            page = context.new_page()
 
         all_files = []
 
-        page.goto(V1_URL)
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(5000)
+        with span("goto"):
+            page.goto(url)
+            page.wait_for_load_state("networkidle")
+            page.wait_for_timeout(5000)
 
         # Dismiss any banner notifications that might block the UI
-        try:
-            print("[INFO] Checking for banner notifications to dismiss")
-            dismiss_btn = page.locator("button:has-text('Dismiss')")
-            if dismiss_btn.is_visible(timeout=3000):
-                dismiss_btn.click()
-                print("[SUCCESS] Dismissed banner notification")
-                page.wait_for_timeout(1000)
-        except Exception as e:
-            print(f"[INFO] No banner to dismiss or already dismissed: {str(e)}")
+        with span("dismiss_banner"):
+            try:
+                print("[INFO] Checking for banner notifications to dismiss")
+                dismiss_btn = page.locator("button:has-text('Dismiss')")
+                if dismiss_btn.is_visible(timeout=3000):
+                    dismiss_btn.click()
+                    print("[SUCCESS] Dismissed banner notification")
+                    page.wait_for_timeout(1000)
+            except Exception as e:
+                print(f"[INFO] No banner to dismiss or already dismissed: {str(e)}")
 
         # Step 1: Export CDAS - 6441 (default view)
-        try:
-            print("[INFO] Exporting CDAS - 6441")
-            wrench = page.locator("svg.wrench").nth(1)
-            wrench.wait_for(state="visible", timeout=10000)
-            wrench.click(timeout=3000)
-            page.wait_for_timeout(1500)
-
-            export_btn = page.locator("text=Export (.xlsx) New")
-            export_btn.wait_for(state="visible", timeout=5000)
-            with page.expect_download(timeout=30000) as download_info:
-                export_btn.click()
-            download = download_info.value
-
-            filename = "tasklist_CDAS6441.xlsx"
-            save_path = os.path.join(DOWNLOAD_DIR, filename)
-            os.makedirs(DOWNLOAD_DIR, exist_ok=True)
-            download.save_as(save_path)
-            all_files.append(save_path)
-
-            print(f"[SUCCESS] {filename} saved")
-            page.wait_for_timeout(5000)
+        if export_default:
+            try:
+                print("[INFO] Exporting CDAS - 6441")
+                with span("export", level="CDAS - 6441"):
+                    wrench = page.locator("svg.wrench").nth(1)
+                    wrench.wait_for(state="visible", timeout=10000)
+                    wrench.click(timeout=3000)
+                    page.wait_for_timeout(1500)
+
+                    export_btn = page.locator("text=Export (.xlsx) New")
+                    export_btn.wait_for(state="visible", timeout=5000)
+                    with page.expect_download(timeout=30000) as download_info:
+                        export_btn.click()
+                    download = download_info.value
+
+                    filename = "tasklist_CDAS6441.xlsx"
+                    save_path = os.path.join(download_dir, filename)
+                    os.makedirs(download_dir, exist_ok=True)
+                    download.save_as(save_path)
+                    all_files.append(save_path)
 
-        except Exception as e:
-            print(f"[ERROR] Failed to export CDAS - 6441: {str(e)}")
+                print(f"[SUCCESS] {filename} saved")
+                page.wait_for_timeout(5000)
+
+            except Exception as e:
+                print(f"[ERROR] Failed to export CDAS - 6441: {str(e)}")
+                failed_levels.append(DEFAULT_LEVEL)
 
         # Step 2: Loop through remaining planning levels
-        for pl in PLANNING_LEVELS:
+        for pl in levels:
             try:
                 print(f"\n[INFO] Selecting planning level: {pl}")
 
-                # Ensure any open modals are closed
-                try:
-                    page.keyboard.press("Escape")
-                    page.wait_for_timeout(500)
-                except:
-                    pass
+                with span("open_selector", level=pl):
+                    # Ensure any open modals are closed
+                    try:
+                        page.keyboard.press("Escape")
+                        page.wait_for_timeout(500)
+                    except:
+                        pass
 
-                # Open dropdown
-                dropdown = page.locator(".new-project-selector")
-                dropdown.wait_for(state="visible", timeout=10000)
-                dropdown.click(force=True)
-                page.wait_for_timeout(2000)
+                    # Open dropdown
+                    dropdown = page.locator(".new-project-selector")
+                    dropdown.wait_for(state="visible", timeout=10000)
+                    dropdown.click(force=True)
+                    page.wait_for_timeout(2000)
 
                 # Find and click the planning level
-                max_attempts = 5
-                matches = []
-                for attempt in range(max_attempts):
-                    matches = page.locator(f"text={pl}").all()
-                    if matches:
-                        break
-                    print(f"[DEBUG] Attempt {attempt+1}: no matches for {pl}")
-                    page.wait_for_timeout(1000)
+                with span("find_level", level=pl):
+                    max_attempts = 5
+                    matches = []
+                    for attempt in range(max_attempts):
+                        matches = page.locator(f"text={pl}").all()
+                        if matches:
+                            break
+                        print(f"[DEBUG] Attempt {attempt+1}: no matches for {pl}")
+                        page.wait_for_timeout(1000)
 
                 match_count = len(matches)
                 print(f"[DEBUG] Found {match_count} matches for {pl}")
@@ -113,100 +139,101 @@ def run_playwright():
                     "#PlanningLevelFilters button:has-text('Apply')"
                 ]
 
-                for i, match in enumerate(matches):
-                    try:
-                        print(f"[DEBUG] Trying match #{i+1}/{match_count} for {pl}")
-                        match.scroll_into_view_if_needed()
-                        match.click(force=True)
-                        page.wait_for_timeout(1500)
-
-                        # Check if Apply button appears after clicking this match
-                        apply_visible = False
-                        for selector in apply_selectors:
-                            try:
-                                apply_btn = page.locator(selector).first
-                                apply_btn.wait_for(state="visible", timeout=1000)
-                                apply_visible = True
-                                print(f"[SUCCESS] Match #{i+1} shows Apply button")
+                with span("probe_matches", level=pl):
+                    for i, match in enumerate(matches):
+                        try:
+                            print(f"[DEBUG] Trying match #{i+1}/{match_count} for {pl}")
+                            match.scroll_into_view_if_needed()
+                            match.click(force=True)
+                            page.wait_for_timeout(1500)
+
+                            # Check if Apply button appears after clicking this match
+                            apply_visible = False
+                            for selector in apply_selectors:
+                                try:
+                                    apply_btn = page.locator(selector).first
+                                    apply_btn.wait_for(state="visible", timeout=1000)
+                                    apply_visible = True
+                                    print(f"[SUCCESS] Match #{i+1} shows Apply button")
+                                    break
+                                except:
+                                    continue
+
+                            if apply_visible:
+                                selected = True
                                 break
-                            except:
-                                continue
+                            else:
+                                print(f"[DEBUG] Match #{i+1} did not show Apply button, trying next")
 
-                        if apply_visible:
-                            selected = True
-                            break
-                        else:
-                            print(f"[DEBUG] Match #{i+1} did not show Apply button, trying next")
-
-                    except Exception as e:
-                        print(f"[DEBUG] Failed to click match #{i+1}: {str(e)}")
+                        except Exception as e:
+                            print(f"[DEBUG] Failed to click match #{i+1}: {str(e)}")
 
                 if not selected:
                     print("[WARN] No match showed Apply button, taking screenshot")
-                    page.screenshot(path=f"no_apply_button_{pl}.png")
+                    capture_failure(page, pl, "no_apply_button", store_dir=store_dir)
                     raise Exception(f"No valid match found for {pl}")
 
-                # Click Apply button
-                print("[INFO] Clicking Apply button")
-                clicked = False
-                for selector in apply_selectors:
-                    try:
-                        apply_btn = page.locator(selector).first
-                        apply_btn.wait_for(state="visible", timeout=3000)
-                        apply_btn.scroll_into_view_if_needed()
-                        page.wait_for_timeout(500)
-                        apply_btn.click(force=True)
-                        print(f"[SUCCESS] Applied using selector: {selector}")
-                        clicked = True
-                        break
-                    except Exception as e:
-                        print(f"[DEBUG] Selector '{selector}' failed: {e}")
-
-                if not clicked:
-                    print("[WARN] Apply button click failed, taking screenshot")
-                    page.screenshot(path=f"apply_button_debug_{pl}.png")
-                    raise Exception("Failed to click Apply button")
+                with span("apply", level=pl):
+                    # Click Apply button
+                    print("[INFO] Clicking Apply button")
+                    clicked = False
+                    for selector in apply_selectors:
+                        try:
+                            apply_btn = page.locator(selector).first
+                            apply_btn.wait_for(state="visible", timeout=3000)
+                            apply_btn.scroll_into_view_if_needed()
+                            page.wait_for_timeout(500)
+                            apply_btn.click(force=True)
+                            print(f"[SUCCESS] Applied using selector: {selector}")
+                            clicked = True
+                            break
+                        except Exception as e:
+                            print(f"[DEBUG] Selector '{selector}' failed: {e}")
 
-                # Wait for the selector modal to close
-                print("[INFO] Waiting for modal to close...")
-                try:
-                    page.wait_for_selector("div.selector-modal", state="hidden", timeout=10000)
-                    print("[SUCCESS] Modal closed")
-                except:
-                    print("[WARN] Modal close timeout, continuing anyway")
+                    if not clicked:
+                        print("[WARN] Apply button click failed, taking screenshot")
+                        capture_failure(page, pl, "apply_button_debug", store_dir=store_dir)
+                        raise Exception("Failed to click Apply button")
 
-                # Wait for page to reload
-                page.wait_for_load_state("networkidle")
-                page.wait_for_timeout(5000)
+                    # Wait for the selector modal to close
+                    print("[INFO] Waiting for modal to close...")
+                    try:
+                        page.wait_for_selector("div.selector-modal", state="hidden", timeout=10000)
+                        print("[SUCCESS] Modal closed")
+                    except:
+                        print("[WARN] Modal close timeout, continuing anyway")
 
-                # Export the report
-                print(f"[INFO] Exporting report for {pl}")
-                wrench = page.locator("svg.wrench").nth(1)
-                wrench.wait_for(state="visible", timeout=10000)
-                wrench.click(timeout=3000)
-                page.wait_for_timeout(1500)
-
-                export_btn = page.locator("text=Export (.xlsx) New")
-                export_btn.wait_for(state="visible", timeout=5000)
-                with page.expect_download(timeout=30000) as download_info:
-                    export_btn.click()
-                download = download_info.value
-
-                tag = pl.replace(" ", "").replace("-", "")
-                filename = f"tasklist_{tag}.xlsx"
-                save_path = os.path.join(DOWNLOAD_DIR, filename)
-                download.save_as(save_path)
-                all_files.append(save_path)
+                    # Wait for page to reload
+                    page.wait_for_load_state("networkidle")
+                    page.wait_for_timeout(5000)
+
+                with span("export", level=pl):
+                    # Export the report
+                    print(f"[INFO] Exporting report for {pl}")
+                    wrench = page.locator("svg.wrench").nth(1)
+                    wrench.wait_for(state="visible", timeout=10000)
+                    wrench.click(timeout=3000)
+                    page.wait_for_timeout(1500)
+
+                    export_btn = page.locator("text=Export (.xlsx) New")
+                    export_btn.wait_for(state="visible", timeout=5000)
+                    with page.expect_download(timeout=30000) as download_info:
+                        export_btn.click()
+                    download = download_info.value
+
+                    tag = pl.replace(" ", "").replace("-", "")
+                    filename = f"tasklist_{tag}.xlsx"
+                    save_path = os.path.join(download_dir, filename)
+                    download.save_as(save_path)
+                    all_files.append(save_path)
 
                 print(f"[SUCCESS] {filename} saved")
                 page.wait_for_timeout(3000)
 
             except Exception as e:
                 print(f"[ERROR] Failed for {pl}: {str(e)}")
-                try:
-                    page.screenshot(path=f"error_{pl}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-                except:
-                    pass
+                failed_levels.append(pl)
+                capture_failure(page, pl, "error", error=str(e), store_dir=store_dir)
 
                 # Try to recover by closing any open modals/menus
                 try:
@@ -219,76 +246,83 @@ def run_playwright():
                     pass
 
         # Step 3: Reset back to CDAS-6441
-        try:
-            print("\n[INFO] Resetting to CDAS - 6441")
+        with span("reset"):
+            try:
+                print("\n[INFO] Resetting to CDAS - 6441")
 
-            # Open dropdown
-            page.locator(".new-project-selector").click(force=True)
-            page.wait_for_timeout(2000)
+                # Open dropdown
+                page.locator(".new-project-selector").click(force=True)
+                page.wait_for_timeout(2000)
 
-            cdas_matches = page.locator("text=CDAS - 6441").all()
-            match_count = len(cdas_matches)
-            print(f"[DEBUG] Found {match_count} matches for CDAS - 6441")
+                cdas_matches = page.locator("text=CDAS - 6441").all()
+                match_count = len(cdas_matches)
+                print(f"[DEBUG] Found {match_count} matches for CDAS - 6441")
 
-            selected = False
-            for i, match in enumerate(cdas_matches):
-                try:
-                    match.scroll_into_view_if_needed()
-                    match.click(force=True)
-                    page.wait_for_timeout(2000)
-                    print(f"[INFO] Clicked CDAS - 6441 match #{i+1}")
-                    selected = True
-                    break
-                except Exception as e:
-                    print(f"[WARN] CDAS - 6441 match #{i+1} failed: {e}")
-
-            # DON'T close dropdown - Apply button is inside it
-            if selected:
-                # Click Apply to confirm selection (dropdown is still open)
-                apply_selectors = [
-                    "button.MuiButton-root:has-text('Apply')",
-                    "button:has(span:text('Apply'))",
-                    "button.MuiButtonBase-root:has-text('Apply')",
-                    "button >> text=Apply",
-                    ".action-buttons button:has-text('Apply')",
-                    "#PlanningLevelFilters button:has-text('Apply')"
-                ]
-
-                clicked = False
-                for selector in apply_selectors:
+                selected = False
+                for i, match in enumerate(cdas_matches):
                     try:
-                        apply_btn = page.locator(selector).first
-                        apply_btn.wait_for(state="visible", timeout=3000)
-                        apply_btn.scroll_into_view_if_needed()
-                        page.wait_for_timeout(500)
-                        apply_btn.click(force=True)
-                        print(f"[SUCCESS] Reset to CDAS - 6441 using selector: {selector}")
-                        clicked = True
+                        match.scroll_into_view_if_needed()
+                        match.click(force=True)
+                        page.wait_for_timeout(2000)
+                        print(f"[INFO] Clicked CDAS - 6441 match #{i+1}")
+                        selected = True
                         break
                     except Exception as e:
-                        print(f"[DEBUG] Apply selector '{selector}' failed: {e}")
+                        print(f"[WARN] CDAS - 6441 match #{i+1} failed: {e}")
+
+                # DON'T close dropdown - Apply button is inside it
+                if selected:
+                    # Click Apply to confirm selection (dropdown is still open)
+                    apply_selectors = [
+                        "button.MuiButton-root:has-text('Apply')",
+                        "button:has(span:text('Apply'))",
+                        "button.MuiButtonBase-root:has-text('Apply')",
+                        "button >> text=Apply",
+                        ".action-buttons button:has-text('Apply')",
+                        "#PlanningLevelFilters button:has-text('Apply')"
+                    ]
+
+                    clicked = False
+                    for selector in apply_selectors:
+                        try:
+                            apply_btn = page.locator(selector).first
+                            apply_btn.wait_for(state="visible", timeout=3000)
+                            apply_btn.scroll_into_view_if_needed()
+                            page.wait_for_timeout(500)
+                            apply_btn.click(force=True)
+                            print(f"[SUCCESS] Reset to CDAS - 6441 using selector: {selector}")
+                            clicked = True
+                            break
+                        except Exception as e:
+                            print(f"[DEBUG] Apply selector '{selector}' failed: {e}")
 
-                if clicked:
-                    page.wait_for_load_state("networkidle")
-                    page.wait_for_timeout(3000)
-            else:
-                print("[WARN] Could not select CDAS - 6441")
+                    if clicked:
+                        page.wait_for_load_state("networkidle")
+                        page.wait_for_timeout(3000)
+                else:
+                    print("[WARN] Could not select CDAS - 6441")
 
-        except Exception as e:
-            print(f"[ERROR] Failed to reset to CDAS - 6441: {e}")
-            try:
-                page.screenshot(path=f"error_reset_cdas_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-            except:
-                pass
+            except Exception as e:
+                print(f"[ERROR] Failed to reset to CDAS - 6441: {e}")
+                capture_failure(page, DEFAULT_LEVEL, "reset", error=str(e), store_dir=store_dir)
 
-        browser.close()
-        merge_tasklists(all_files)
+        with span("browser_close"):
+            browser.close()
+        if planning_levels is not None:
+            all_files = [level_file(download_dir, pl) for pl in [DEFAULT_LEVEL] + PLANNING_LEVELS
+                         if os.path.exists(level_file(download_dir, pl))]
+        with span("merge"):
+            merge_tasklists(all_files, os.path.join(download_dir, os.path.basename(FINAL_OUTPUT)),
+                            os.path.join(download_dir, PUBLISHED_CSV), os.path.join(download_dir, HANDOFF_DIR))
 
-def merge_tasklists(file_paths):
+    return failed_levels
+
+def merge_tasklists(file_paths, output_path=FINAL_OUTPUT, csv_path=None, handoff_dir=None):
     dfs = []
     for f in file_paths:
         try:
-            df = pd.read_excel(f)
+            with span("read_export", file=os.path.basename(f)):
+                df = pd.read_excel(f)
             print(f"\n[DEBUG] Processing: {f}")
             print(f"[DEBUG] Rows in file: {len(df)}")
 
@@ -326,7 +360,8 @@ def merge_tasklists(file_paths):
             print(f"[ERROR] Failed to read {f}: {str(e)}")
 
     if dfs:
-        tasklist_df = pd.concat(dfs, ignore_index=True)
+        with span("concat"):
+            tasklist_df = pd.concat(dfs, ignore_index=True)
         print(f"\n[DEBUG] ===== FINAL MERGED FILE =====")
         print(f"[DEBUG] Total rows: {tasklist_df.shape[0]}")
         print(f"[DEBUG] Total columns: {tasklist_df.shape[1]}")
@@ -341,21 +376,44 @@ def merge_tasklists(file_paths):
                 est_hours = pl_df['Est. Hours'].sum() if 'Est. Hours' in pl_df.columns else 0
                 print(f"  {pl}: {row_count} rows, Est: {est_hours:.2f}h, Completed: {completed_hours:.2f}h")
 
-        # Debug: Check for duplicate IDs
-        if 'ID' in tasklist_df.columns:
-            duplicate_ids = tasklist_df[tasklist_df.duplicated(subset=['ID'], keep=False)]
-            if not duplicate_ids.empty:
-                print(f"\n[WARN] Found {len(duplicate_ids)} rows with duplicate IDs")
-                print(f"[WARN] Unique duplicate IDs: {duplicate_ids['ID'].nunique()}")
-                print(f"[INFO] This is expected if tasks belong to multiple Planning Levels")
-
-        tasklist_df.to_excel(FINAL_OUTPUT, index=False, engine="openpyxl")
-        print(f"\n[SUCCESS] Combined Excel saved to {FINAL_OUTPUT}")
+        # Tasks that belong to several Planning Levels appear in each of their exports; store them once
+        with span("index_tasks"):
+            row_count = len(tasklist_df)
+            tasklist_df = index_tasks(tasklist_df)
+        if len(tasklist_df) < row_count:
+            print(f"\n[INFO] Collapsed {row_count - len(tasklist_df)} rows with duplicate IDs: "
+                  f"{len(tasklist_df)} unique tasks, their levels joined in 'Planning Level'")
+
+        with span("write_xlsx"):
+            tasklist_df.to_excel(output_path, index=False, engine="openpyxl")
+        print(f"\n[SUCCESS] Combined Excel saved to {output_path}")
+
+        if csv_path:
+            # Stable row order and line endings so an unchanged export produces an identical file and git diffs stay small
+            with span("write_csv"):
+                os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+                sort_cols = [c for c in ("ID", "Planning Level") if c in tasklist_df.columns]
+                tasklist_df.sort_values(sort_cols, kind="stable").to_csv(csv_path, index=False, lineterminator="\n")
+            print(f"[SUCCESS] Published CSV saved to {csv_path}")
+
+        if handoff_dir:
+            # Arrow copy for dashboards running on this machine, read without a parse step (see arrow_handoff.py)
+            try:
+                with span("write_arrow"):
+                    pointer = publish_frame(tasklist_df, handoff_dir)
+                print(f"[SUCCESS] Arrow handoff version {pointer['version']} saved to {handoff_dir}")
+            except Exception as e:
+                print(f"[WARN] Arrow handoff skipped: {e}")
     else:
         print("[ERROR] No files to merge")
 
 if __name__ == "__main__":
-    run_playwright()
+    from run_metrics import start_run, finish_run
+    start_run("scrape")
+    try:
+        run_playwright()
+    finally:
+        finish_run()
 
 
 
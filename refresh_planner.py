@@ -0,0 +1,141 @@
+import argparse
+import hashlib
+import json
+import math
+import os
+import zipfile
+from datetime import datetime
+from playwright_advanced import DEFAULT_LEVEL, DOWNLOAD_DIR, PLANNING_LEVELS, level_file
+from run_metrics import load_runs
+
+# Decides which planning levels each scheduler cycle re-exports. Every refresh records whether the
+# level's export changed and how long it took (from the run's spans in logs/run_metrics.jsonl), giving
+# a per-level change rate. Each cycle picks the levels most likely to be stale per second of scraping
+# until REFRESH_BUDGET_SECONDS is used; any level older than MAX_STALENESS_HOURS is always included.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = os.path.join(BASE_DIR, "logs", "refresh_state.json")
+ALL_LEVELS = [DEFAULT_LEVEL] + PLANNING_LEVELS
+REFRESH_BUDGET_SECONDS = 240
+MAX_STALENESS_HOURS = 24
+DEFAULT_LEVEL_SECONDS = 60
+# Older observations fade out so a level that gets busy (or goes quiet) is picked up within a few days
+DECAY = 0.9
+# Prior of one change per day, weighted as one day of observation, until a level has history
+PRIOR_CHANGES, PRIOR_HOURS = 1.0, 24.0
+
+
+def load_state(path=STATE_FILE):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state, path=STATE_FILE):
+    # Written to a temp file first so a crash mid-write cannot leave half a state file behind
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def export_hash(path):
+    # Hash the workbook parts rather than the file: docProps carries the export time and changes every run
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(path) as z:
+        for name in sorted(z.namelist()):
+            if not name.startswith("docProps/"):
+                digest.update(name.encode("utf-8"))
+                digest.update(z.read(name))
+    return digest.hexdigest()
+
+
+def change_rate(entry):
+    # Changes per hour, from decayed counts of observed changes and observed hours
+    return (entry.get("changes", 0.0) + PRIOR_CHANGES) / (entry.get("hours", 0.0) + PRIOR_HOURS)
+
+
+def hours_since(entry, now):
+    return (now - datetime.fromisoformat(entry["last_refreshed"])).total_seconds() / 3600
+
+
+def priority(entry, now):
+    # Probability the level has changed since its last refresh (Poisson), per second of scrape time
+    if not entry.get("last_refreshed"):
+        return math.inf
+    stale = 1 - math.exp(-change_rate(entry) * hours_since(entry, now))
+    return stale / entry.get("seconds", DEFAULT_LEVEL_SECONDS)
+
+
+def plan_refresh(state, budget_seconds=REFRESH_BUDGET_SECONDS, levels=ALL_LEVELS, now=None):
+    now = now or datetime.now()
+    entries = {pl: state.get(pl, {}) for pl in levels}
+    plan, spent = [], 0.0
+    for pl in levels:
+        entry = entries[pl]
+        if not entry.get("last_refreshed") or hours_since(entry, now) >= MAX_STALENESS_HOURS:
+            plan.append(pl)
+            spent += entry.get("seconds", DEFAULT_LEVEL_SECONDS)
+    for pl in sorted(levels, key=lambda pl: priority(entries[pl], now), reverse=True):
+        cost = entries[pl].get("seconds", DEFAULT_LEVEL_SECONDS)
+        # The top level always goes in, so a budget smaller than one level still makes progress
+        if pl not in plan and (spent + cost <= budget_seconds or not plan):
+            plan.append(pl)
+            spent += cost
+    # Keep the scrape order stable: the default view first, then PLANNING_LEVELS order
+    return [pl for pl in levels if pl in plan]
+
+
+def level_seconds(run):
+    # Per-level scrape time from a pipeline run's spans (open_selector, find_level, ..., export)
+    seconds = {}
+    for s in run.get("spans", []):
+        if "level" in s and s["status"] == "ok":
+            seconds[s["level"]] = seconds.get(s["level"], 0.0) + s["seconds"]
+    return seconds
+
+
+def record_refresh(state, refreshed, download_dir=DOWNLOAD_DIR, now=None):
+    # Call after a successful run with the levels that exported; updates hashes, change rates and durations
+    now = now or datetime.now()
+    last_run = load_runs(name="pipeline", last=1)
+    seconds = level_seconds(last_run[0]) if last_run else {}
+    for pl in refreshed:
+        path = level_file(download_dir, pl)
+        if not os.path.exists(path):
+            continue
+        entry = state.setdefault(pl, {})
+        content_hash = export_hash(path)
+        if entry.get("last_refreshed"):
+            changed = content_hash != entry.get("content_hash")
+            entry["changes"] = entry.get("changes", 0.0) * DECAY + changed
+            entry["hours"] = entry.get("hours", 0.0) * DECAY + hours_since(entry, now)
+            if changed:
+                entry["last_changed"] = now.isoformat(timespec="seconds")
+        if pl in seconds:
+            entry["seconds"] = round(seconds[pl] if "seconds" not in entry
+                                     else entry["seconds"] * DECAY + seconds[pl] * (1 - DECAY), 2)
+        entry["content_hash"] = content_hash
+        entry["last_refreshed"] = now.isoformat(timespec="seconds")
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show per-level change rates and the next refresh plan")
+    parser.add_argument("--budget", type=float, default=REFRESH_BUDGET_SECONDS, help="Seconds of level scraping per cycle")
+    parser.add_argument("--state", default=STATE_FILE)
+    args = parser.parse_args()
+
+    state, now = load_state(args.state), datetime.now()
+    plan = plan_refresh(state, args.budget, now=now)
+    print(f"{'level':<16}{'changes/day':>12}{'avg s':>8}{'hours since':>13}{'priority':>10}  next cycle")
+    for pl in ALL_LEVELS:
+        entry = state.get(pl, {})
+        since = f"{hours_since(entry, now):.1f}" if entry.get("last_refreshed") else "never"
+        print(f"{pl:<16}{change_rate(entry) * 24:>12.2f}{entry.get('seconds', DEFAULT_LEVEL_SECONDS):>8.0f}"
+              f"{since:>13}{priority(entry, now):>10.4f}  {'yes' if pl in plan else ''}")
+
+
+if __name__ == "__main__":
+    main()
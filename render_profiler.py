@@ -0,0 +1,74 @@
+import contextlib
+import os
+import time
+from datetime import datetime
+import pandas as pd
+import streamlit as st
+
+# Opt-in per-rerun timing for app.py: enable with ?profile=1 in the URL or DASHBOARD_PROFILE=1
+HISTORY_KEY = "_render_profile_history"
+HISTORY_LIMIT = 50
+
+
+def profiling_enabled():
+    return os.environ.get("DASHBOARD_PROFILE") == "1" or st.query_params.get("profile") == "1"
+
+
+class RenderProfiler:
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.sections = {}
+
+    def section(self, name):
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections[name] = self.sections.get(name, 0.0) + time.perf_counter() - start
+
+    def render_panel(self, data_load=None):
+        # data_load: (loaded_at, {section: seconds}) for the data load behind this rerun when it ran
+        # outside it, on app.py's watcher thread
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self.started
+        history = st.session_state.setdefault(HISTORY_KEY, [])
+        history.append({"rerun_at": datetime.now().isoformat(timespec="seconds"), "total": total,
+                        "sections": dict(self.sections)})
+        del history[:-HISTORY_LIMIT]
+
+        current = pd.DataFrame(
+            [(name, seconds * 1000, seconds / total * 100) for name, seconds in self.sections.items()],
+            columns=["Section", "ms", "% of rerun"]
+        ).sort_values("ms", ascending=False)
+
+        rows = [(h["rerun_at"], "(rerun total)", h["total"] * 1000) for h in history]
+        rows += [(h["rerun_at"], name, s * 1000) for h in history for name, s in h["sections"].items()]
+        long_form = pd.DataFrame(rows, columns=["Rerun At", "Section", "ms"])
+        trend = long_form.groupby("Section")["ms"].agg(["count", "mean", "max"]).sort_values("mean", ascending=False)
+
+        with st.sidebar.expander("⏱️ Performance profile", expanded=True):
+            st.metric("This rerun", f"{total * 1000:,.0f} ms")
+            st.dataframe(current.round(1), hide_index=True, use_container_width=True)
+            st.caption(f"Last {len(history)} reruns in this session")
+            st.dataframe(trend.round(1), use_container_width=True)
+            if data_load:
+                loaded_at, sections = data_load
+                st.caption(f"Data load on the watcher thread at {loaded_at.strftime('%H:%M:%S')}")
+                load_df = pd.DataFrame([(name, seconds * 1000) for name, seconds in sections.items()],
+                                       columns=["Section", "ms"])
+                st.dataframe(load_df.round(1), hide_index=True, use_container_width=True)
+            st.download_button(
+                label="📥 Export profile (CSV)",
+                data=lambda: long_form.to_csv(index=False).encode("utf-8"),
+                file_name=f"render_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv",
+                on_click="ignore"
+            )
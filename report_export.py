@@ -0,0 +1,104 @@
+import io
+import re
+
+SHEET_NAME_LIMIT = 31
+INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+
+# Exports come back as a rewound BytesIO rather than bytes: getvalue() would make a second full copy.
+# Write buffer.getbuffer() to a file, or hand the buffer to st.download_button, which copies it once
+# into its media store.
+
+
+def export_csv(frame):
+    # Encode straight into a byte buffer instead of building a str and then a bytes copy of it
+    buffer = io.BytesIO()
+    frame.to_csv(buffer, index=False, encoding='utf-8')
+    buffer.seek(0)
+    return buffer
+
+
+def _sheet_title(name, used):
+    title = INVALID_SHEET_CHARS.sub('_', str(name)).strip() or 'Sheet'
+    title = title[:SHEET_NAME_LIMIT]
+    base, n = title, 2
+    while title.lower() in used:
+        suffix = f" ({n})"
+        title = base[:SHEET_NAME_LIMIT - len(suffix)] + suffix
+        n += 1
+    used.add(title.lower())
+    return title
+
+
+def _cell(value):
+    # openpyxl cannot write numpy scalars or NaN directly
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+def _write_frame(ws, frame):
+    ws.append(frame.columns.tolist())
+    for row in frame.itertuples(index=False, name=None):
+        ws.append([_cell(v) for v in row])
+
+
+def export_sprint_pack(sprint_df, project_cols, task_cols):
+    # Imported here rather than at module top: app.py imports this module on every cold start, but the
+    # sprint pack is only built when someone clicks download
+    from openpyxl import Workbook
+
+    # Write-only workbooks stream rows to disk as they are appended rather than keeping every cell object in memory
+    wb = Workbook(write_only=True)
+    used = set()
+
+    est = sprint_df['Est. Hours'].sum()
+    completed = sprint_df['Completed Hours'].sum()
+    remaining = sprint_df['To Do'].sum()
+    progress = (completed / est * 100) if est > 0 else 0
+
+    ws = wb.create_sheet(_sheet_title('Summary', used))
+    ws.append(['Metric', 'Value'])
+    ws.append(['Total Estimated Hours', round(float(est), 1)])
+    ws.append(['Completed Hours', round(float(completed), 1)])
+    ws.append(['Remaining Hours', round(float(remaining), 1)])
+    ws.append(['Progress %', round(float(progress), 1)])
+    ws.append(['Tasks', len(sprint_df)])
+    ws.append([])
+    ws.append(['Status', 'Est. Hours', 'Tasks'])
+    status_summary = sprint_df.groupby('Status').agg({'Est. Hours': 'sum', 'Title': 'count'}).reset_index()
+    for row in status_summary.itertuples(index=False, name=None):
+        ws.append([_cell(v) for v in row])
+
+    ws = wb.create_sheet(_sheet_title('By Contractor Group', used))
+    group_summary = sprint_df.groupby('Contractor Group').agg({
+        'Title': 'count',
+        'Est. Hours': 'sum',
+        'Completed Hours': 'sum',
+        'To Do': 'sum'
+    }).reset_index().sort_values('Est. Hours', ascending=False)
+    group_summary.columns = ['Contractor Group', 'Task Count', 'Est. Hours', 'Completed Hours', 'To Do']
+    _write_frame(ws, group_summary)
+
+    ws = wb.create_sheet(_sheet_title('By Project', used))
+    project_summary = sprint_df[project_cols].sum().reset_index()
+    project_summary.columns = ['Project', 'Hours']
+    _write_frame(ws, project_summary)
+
+    for group, group_df in sprint_df.groupby('Contractor Group'):
+        ws = wb.create_sheet(_sheet_title(f"Group - {group}", used))
+        _write_frame(ws, group_df[task_cols])
+
+    for proj in project_cols:
+        proj_df = sprint_df[sprint_df[proj] > 0]
+        if proj_df.empty:
+            continue
+        ws = wb.create_sheet(_sheet_title(f"Project - {proj}", used))
+        _write_frame(ws, proj_df[task_cols].sort_values(proj, ascending=False) if proj in task_cols else proj_df[task_cols])
+
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer
@@ -2,7 +2,9 @@
 setlocal
 set PLAYWRIGHT_SKIP_VALIDATE_DEPENDENCIES=1
 call "C:\Users\tbh2j0\OneDrive - USPS\Test Folder\databricks_env_new\Scripts\activate.bat"
-python "C:\Users\tbh2j0\OneDrive - USPS\Test Folder\versionone_dashboard\automate_dashboard.py"
+rem Starts the resident scheduler (probe, backoff, circuit breaker). Trigger this task once at logon and keep
+rem "Do not start a new instance" set; use "scheduler.py --once" for a single probed run instead.
+python "C:\Users\tbh2j0\OneDrive - USPS\Test Folder\versionone_dashboard\scheduler.py"
 endlocal
 
 
@@ -0,0 +1,162 @@
+import argparse
+import contextlib
+import gzip
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime
+from automation_logging import log_segments
+
+# Timing spans for the scrape -> merge -> push pipeline. Each run is written as one JSON line
+# to logs/run_metrics.jsonl; `python run_metrics.py summary` reports p50/p95 per step across runs.
+# The file rolls over into gzipped segments like logs/automation.jsonl (run_metrics.jsonl.1.gz is the
+# newest), so readers that only need recent runs never parse more than MAX_BYTES.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+METRICS_FILE = os.path.join(BASE_DIR, "logs", "run_metrics.jsonl")
+MAX_BYTES = 1024 * 1024
+BACKUP_COUNT = 20
+
+_current_run = None
+
+
+class RunMetrics:
+    def __init__(self, name, path=METRICS_FILE):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.path = path
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self.spans = []
+
+    @contextlib.contextmanager
+    def span(self, step, **tags):
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            self.spans.append({"step": step, "seconds": round(time.perf_counter() - start, 4),
+                               "status": status, **tags})
+
+    def record(self, step, at=None, **tags):
+        # A milestone rather than a timed block: seconds from the start of the run to `at` (a
+        # time.perf_counter() value, default now)
+        at = time.perf_counter() if at is None else at
+        self.spans.append({"step": step, "seconds": round(at - self._start, 4), "status": "ok", **tags})
+
+    def finish(self, status="ok"):
+        record = {
+            "run_id": self.run_id,
+            "name": self.name,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "seconds": round(time.perf_counter() - self._start, 4),
+            "status": status,
+            "spans": self.spans,
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        rotate(self.path)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        return record
+
+
+def start_run(name, path=METRICS_FILE):
+    global _current_run
+    _current_run = RunMetrics(name, path)
+    return _current_run
+
+
+def finish_run(status="ok"):
+    global _current_run
+    run, _current_run = _current_run, None
+    return run.finish(status) if run else None
+
+
+def span(step, **tags):
+    # Outside a run (e.g. merge_tasklists called from a benchmark) spans cost nothing and are not recorded
+    if _current_run is None:
+        return contextlib.nullcontext()
+    return _current_run.span(step, **tags)
+
+
+def rotate(path=METRICS_FILE, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+    # Called before each append; the segment past backup_count is overwritten and so dropped
+    if not os.path.exists(path) or os.path.getsize(path) < max_bytes:
+        return False
+    for i in range(backup_count - 1, 0, -1):
+        if os.path.exists(f"{path}.{i}.gz"):
+            os.replace(f"{path}.{i}.gz", f"{path}.{i + 1}.gz")
+    with open(path, "rb") as f_in, gzip.open(f"{path}.1.gz", "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(path)
+    return True
+
+
+def load_runs(path=METRICS_FILE, name=None, last=None, history=False):
+    # Only the current segment unless history=True, which also reads the rotated ones, oldest first
+    runs = []
+    for segment in log_segments(path) if history else [path]:
+        if not os.path.exists(segment):
+            continue
+        opener = gzip.open if segment.endswith(".gz") else open
+        with opener(segment, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    run = json.loads(line)
+                    if name is None or run["name"] == name:
+                        runs.append(run)
+    return runs[-last:] if last else runs
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def summarize(runs, by_tag=None):
+    steps = {}
+    for run in runs:
+        steps.setdefault("(run total)", []).append(run["seconds"])
+        for s in run["spans"]:
+            key = s["step"] if not by_tag or by_tag not in s else f"{s['step']} [{s[by_tag]}]"
+            steps.setdefault(key, []).append(s["seconds"])
+    rows = []
+    for step, values in steps.items():
+        rows.append((step, len(values), percentile(values, 50), percentile(values, 95), sum(values)))
+    return sorted(rows, key=lambda r: r[4], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline run metrics")
+    sub = parser.add_subparsers(dest="command", required=True)
+    summary = sub.add_parser("summary", help="p50/p95 per step across runs")
+    summary.add_argument("--file", default=METRICS_FILE)
+    summary.add_argument("--name", default=None, help="Only runs with this name (e.g. pipeline)")
+    summary.add_argument("--last", type=int, default=None, help="Only the most recent N runs")
+    summary.add_argument("--by", default=None, help="Split steps by a span tag, e.g. --by level")
+    summary.add_argument("--history", action="store_true", help="Include the rotated .gz segments")
+    args = parser.parse_args()
+
+    runs = load_runs(args.file, args.name, args.last, args.history)
+    if not runs:
+        print(f"[INFO] No runs recorded in {args.file}")
+        return
+    failed = sum(1 for r in runs if r["status"] != "ok")
+    print(f"[INFO] {len(runs)} runs ({failed} failed) from {runs[0]['started_at']} to {runs[-1]['started_at']}")
+    print(f"{'step':<44}{'count':>7}{'p50 s':>10}{'p95 s':>10}{'total s':>11}")
+    for step, count, p50, p95, total in summarize(runs, args.by):
+        print(f"{step:<44}{count:>7}{p50:>10.2f}{p95:>10.2f}{total:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import argparse
+import random
+import socket
+import time
+from urllib.parse import urlparse
+from automation_logging import get_logger, failure_cause
+from playwright_advanced import V1_URL
+from refresh_planner import REFRESH_BUDGET_SECONDS, load_state, plan_refresh, record_refresh, save_state
+
+# Long-running replacement for the run_dashboard.bat trigger. Before each run it checks that VersionOne
+# resolves and accepts a TCP connection, so an outage costs a DNS lookup instead of a browser launch and
+# a 30 s goto timeout. Failed probes/runs back off exponentially; after FAILURE_THRESHOLD in a row the
+# circuit opens and nothing runs for a cooldown, then one trial probe + run is let through (half-open):
+# success closes the circuit, failure reopens it with a longer cooldown cap. Levels that fail are retried
+# on their own.
+# Each cycle scrapes the levels refresh_planner.py picks for the time budget, not every level.
+RUN_INTERVAL_MINUTES = 30
+PROBE_TIMEOUT = 5
+FAILURE_THRESHOLD = 3
+BASE_BACKOFF_SECONDS = 60
+MAX_BACKOFF_SECONDS = 30 * 60
+OPEN_COOLDOWN_SECONDS = 10 * 60
+LEVEL_RETRY_SECONDS = 5 * 60
+
+log = get_logger("scheduler")
+
+
+def probe_reachability(url=V1_URL, timeout=PROBE_TIMEOUT):
+    # Returns None when the host resolves and accepts a connection, otherwise the failure cause
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        address = socket.getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)[0][4]
+    except socket.gaierror:
+        return "ERR_NAME_NOT_RESOLVED"
+    try:
+        with socket.create_connection(address[:2], timeout=timeout):
+            return None
+    except socket.timeout:
+        return "ERR_CONNECTION_TIMED_OUT"
+    except OSError as e:
+        return f"ERR_CONNECTION_FAILED ({e.strerror or e})"
+
+
+def backoff_delay(attempt, base=BASE_BACKOFF_SECONDS, cap=MAX_BACKOFF_SECONDS):
+    # Full jitter so several machines coming back from the same outage do not retry in lockstep
+    return random.uniform(base / 2, min(cap, base * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    # closed -> open after failure_threshold failures in a row; open -> half-open once the cooldown has
+    # passed. Cooldowns are jittered like backoff_delay; each failed half-open trial doubles the upper
+    # bound of the next one, up to MAX_BACKOFF_SECONDS.
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, cooldown=OPEN_COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.trials = 0
+        self.opened_at = None
+        self.open_for = 0
+        self.last_cause = None
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "open" if self.retry_after() > 0 else "half_open"
+
+    def retry_after(self):
+        # Seconds until the next half-open trial; 0 when closed or already half-open
+        if self.opened_at is None:
+            return 0
+        return max(0, self.opened_at + self.open_for - time.monotonic())
+
+    def allow(self):
+        return self.state != "open"
+
+    def _open(self):
+        self.opened_at = time.monotonic()
+        self.open_for = backoff_delay(self.trials + 1, base=self.cooldown)
+        return self.open_for
+
+    def record_failure(self, cause):
+        self.failures += 1
+        self.last_cause = cause
+        if self.opened_at is not None:
+            self.trials += 1
+            delay = self._open()
+            log.warning(f"Trial run failed ({cause}); circuit reopened for {delay:.0f}s",
+                        extra={"event": "circuit_reopen", "trials": self.trials})
+            return delay
+        if self.failures >= self.failure_threshold:
+            delay = self._open()
+            log.warning(f"Circuit opened after {self.failures} failures ({cause}); one trial run in {delay:.0f}s",
+                        extra={"event": "circuit_open"})
+            return delay
+        return backoff_delay(self.failures)
+
+    def record_success(self):
+        if self.opened_at is not None:
+            log.info(f"Circuit closed after {self.failures} failures", extra={"event": "circuit_closed"})
+        self.failures = 0
+        self.trials = 0
+        self.opened_at = None
+        self.last_cause = None
+
+
+def run_once(url=V1_URL, budget_seconds=REFRESH_BUDGET_SECONDS):
+    # One probed, planned cycle, for use from Task Scheduler instead of the daemon
+    from automate_dashboard import run_pipeline
+
+    cause = probe_reachability(url)
+    if cause:
+        log.error(f"VersionOne unreachable ({cause}); skipping run", extra={"event": "probe_failed", "cause": cause})
+        return
+    levels = plan_refresh(load_state(), budget_seconds)
+    try:
+        failed_levels = run_pipeline(levels)
+    except Exception:
+        log.exception("Workflow failed", extra={"step": "pipeline"})
+        return
+    save_state(record_refresh(load_state(), [pl for pl in levels if pl not in failed_levels]))
+    if failed_levels:
+        log.warning(f"Levels failed: {', '.join(failed_levels)}", extra={"event": "levels_failed", "levels": failed_levels})
+
+
+def run_forever(interval_minutes=RUN_INTERVAL_MINUTES, url=V1_URL, budget_seconds=REFRESH_BUDGET_SECONDS):
+    # Imported here so the probe and breaker can be used without Playwright or the report workers
+    from automate_dashboard import run_pipeline
+
+    breaker = CircuitBreaker()
+    pending_levels = None  # None means a planned cycle; otherwise only these failed levels are re-scraped
+    level_retries = 0
+    next_cycle = time.monotonic()
+
+    while True:
+        if not breaker.allow():
+            time.sleep(breaker.retry_after())
+            continue
+        if breaker.state == "half_open":
+            log.info("Circuit half-open; letting one trial run through", extra={"event": "circuit_half_open"})
+        cause = probe_reachability(url)
+        if cause:
+            delay = breaker.record_failure(cause)
+            # ERROR like the pipeline failures, so outages show up in `automation_logging.py failures`
+            log.error(f"VersionOne unreachable ({cause}); next probe in {delay:.0f}s",
+                      extra={"event": "probe_failed", "cause": cause})
+            time.sleep(delay)
+            continue
+
+        levels = pending_levels or plan_refresh(load_state(), budget_seconds)
+        try:
+            failed_levels = run_pipeline(levels)
+        except Exception as e:
+            cause = failure_cause(str(e))
+            delay = breaker.record_failure(cause)
+            log.exception(f"Workflow failed; retrying in {delay:.0f}s", extra={"step": "pipeline", "cause": cause})
+            time.sleep(delay)
+            continue
+
+        breaker.record_success()
+        save_state(record_refresh(load_state(), [pl for pl in levels if pl not in failed_levels]))
+        if pending_levels is None:
+            next_cycle = time.monotonic() + interval_minutes * 60
+        pending_levels = None
+
+        if failed_levels:
+            level_retries += 1
+            retry_in = backoff_delay(level_retries, base=LEVEL_RETRY_SECONDS)
+            if time.monotonic() + retry_in < next_cycle:
+                pending_levels = failed_levels
+                log.info(f"Retrying {', '.join(failed_levels)} in {retry_in:.0f}s",
+                         extra={"event": "levels_pending", "levels": failed_levels})
+                time.sleep(retry_in)
+                continue
+            log.warning(f"Leaving {', '.join(failed_levels)} for the next cycle",
+                        extra={"event": "levels_abandoned", "levels": failed_levels})
+        level_retries = 0
+        time.sleep(max(0, next_cycle - time.monotonic()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the VersionOne scrape -> push pipeline on a schedule")
+    parser.add_argument("--interval", type=float, default=RUN_INTERVAL_MINUTES, help="Minutes between refresh cycles")
+    parser.add_argument("--url", default=V1_URL, help="URL probed before each run")
+    parser.add_argument("--budget", type=float, default=REFRESH_BUDGET_SECONDS,
+                        help="Seconds of planning-level scraping per cycle (see refresh_planner.py)")
+    parser.add_argument("--once", action="store_true", help="Probe and run once instead of staying resident")
+    parser.add_argument("--probe", action="store_true", help="Only check reachability and exit")
+    args = parser.parse_args()
+
+    if args.probe:
+        cause = probe_reachability(args.url)
+        print(f"[INFO] {urlparse(args.url).hostname}: {cause or 'reachable'}")
+        return
+    if args.once:
+        run_once(args.url, args.budget)
+        return
+    log.info(f"Scheduler started: refresh cycle every {args.interval:g} min", extra={"event": "scheduler_start"})
+    try:
+        run_forever(args.interval, args.url, args.budget)
+    except KeyboardInterrupt:
+        log.info("Scheduler stopped", extra={"event": "scheduler_stop"})
+
+
+# The sprint report workers re-import the main module on Windows, so nothing may run at import time
+if __name__ == "__main__":
+    main()
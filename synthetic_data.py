@@ -0,0 +1,128 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+# Synthetic VersionOne exports and Contractor File with the same schema as the real ones,
+# used by the benchmarks, the mock VersionOne server and the dashboard load test
+
+EXPORT_COLS = ['Title', 'ID', 'Owner', 'Status', 'Est. Hours', 'To Do', 'Backlog', 'Sprint', 'Planning Level']
+CONTRACTOR_PROJECT_COLS = ['CDAS-6441', 'EDS-4834', 'EEB-9372', 'UAP-SPM-9442', 'UAP-IV-9443', 'UAPSAL-9402']
+
+# Planning level -> (export file tag, share of rows), roughly matching the live exports
+PLANNING_LEVEL_SHARES = {
+    "CDAS - 6441": ("CDAS6441", 0.19),
+    "EDS-4834": ("EDS4834", 0.09),
+    "EEB-9372": ("EEB9372", 0.15),
+    "UAP-IV-9443": ("UAPIV9443", 0.10),
+    "UAPSAL-9402": ("UAPSAL9402", 0.16),
+    "UAP-SPM-9442": ("UAPSPM9442", 0.31),
+}
+BASE_ROWS = 10_000
+STATUSES = ['In Progress', 'Completed', None]
+STATUS_WEIGHTS = [0.64, 0.25, 0.11]
+CONTRACTOR_GROUPS = ['Accenture', 'Deloitte', 'IBM', 'Infosys', 'KPMG', 'USPS', 'Wipro', 'Cognizant']
+WORDS = ['APEX', 'ETVS', 'staging', 'pipeline', 'ingest', 'SIT', 'promotion', 'testing', 'notification',
+         'development', 'Databricks', 'migration', 'report', 'validation', 'refactor', 'aging', 'UAP', 'CDAS']
+
+
+def sprint_labels(rng, n):
+    # Mix of the label styles seen in the live data: "Sprint 264", "Sprint26", "SP02FY24", "SP 03 FY21"
+    number = rng.integers(1, 300, n)
+    style = rng.integers(0, 4, n)
+    fy = rng.integers(20, 27, n)
+    labels = np.where(style == 0, [f"Sprint {x}" for x in number],
+             np.where(style == 1, [f"Sprint{x}" for x in number],
+             np.where(style == 2, [f"SP{x % 27:02d}FY{y}" for x, y in zip(number, fy)],
+                      [f"SP {x % 27:02d} FY{y}" for x, y in zip(number, fy)])))
+    return labels
+
+
+def owner_names(n):
+    return [f"Contractor {i:03d}" for i in range(n)]
+
+
+def generate_tasks(rows, seed=0, owners=276, duplicate_rate=0.02):
+    rng = np.random.default_rng(seed)
+    levels = list(PLANNING_LEVEL_SHARES)
+    shares = np.array([PLANNING_LEVEL_SHARES[pl][1] for pl in levels])
+
+    title_words = rng.choice(WORDS, size=(rows, 4))
+    est = rng.choice([0, 1, 2, 4, 6, 8, 12, 16, 24, 30, 40], rows).astype(float)
+    todo = np.round(est * rng.choice([0, 0, 0.25, 0.5, 1], rows), 1)
+    statuses = rng.choice(np.array(STATUSES, dtype=object), rows, p=STATUS_WEIGHTS)
+    backlog = np.where(rng.random(rows) < 0.85, [' '.join(w) for w in title_words[:, :3]], None)
+
+    df = pd.DataFrame({
+        'Title': [' '.join(w) for w in title_words],
+        'ID': [f"TK-{2_000_000 + i}" for i in range(rows)],
+        'Owner': rng.choice(owner_names(owners), rows),
+        'Status': statuses,
+        'Est. Hours': est,
+        'To Do': todo,
+        'Backlog': backlog,
+        'Sprint': sprint_labels(rng, rows),
+        'Planning Level': rng.choice(levels, rows, p=shares / shares.sum()),
+    })
+
+    # Tasks that belong to more than one planning level show up in several exports
+    dup_count = int(rows * duplicate_rate)
+    if dup_count:
+        dups = df.sample(dup_count, random_state=seed).copy()
+        dups['Planning Level'] = rng.choice(levels, dup_count)
+        df = pd.concat([df, dups], ignore_index=True)
+    return df[EXPORT_COLS]
+
+
+def generate_contractor_file(owners=276, listed=160, seed=0):
+    rng = np.random.default_rng(seed)
+    names = owner_names(owners)[:listed]
+    df = pd.DataFrame({
+        'Contractor Group': rng.choice(CONTRACTOR_GROUPS, listed),
+        'Names': names,
+        'Unnamed: 2': None,
+    })
+    for col in CONTRACTOR_PROJECT_COLS:
+        df[col] = rng.choice([0, 0, 0, 1], listed)
+    return df
+
+
+def write_xlsx(df, path):
+    # Write-only workbook: much faster than DataFrame.to_excel for the large scales
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(df.columns.tolist())
+    for row in df.itertuples(index=False, name=None):
+        ws.append([None if isinstance(v, float) and v != v else v for v in row])
+    wb.save(path)
+
+
+def write_synthetic_exports(out_dir, scale=1, seed=0):
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = generate_tasks(BASE_ROWS * scale, seed=seed)
+    paths = []
+    for planning_level, level_df in tasks.groupby('Planning Level'):
+        tag = PLANNING_LEVEL_SHARES[planning_level][0]
+        path = os.path.join(out_dir, f"tasklist_{tag}.xlsx")
+        write_xlsx(level_df, path)
+        paths.append(path)
+    contractor_path = os.path.join(out_dir, "Contractor File.xlsx")
+    write_xlsx(generate_contractor_file(seed=seed), contractor_path)
+    return paths, contractor_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write synthetic tasklist_*.xlsx exports and a Contractor File")
+    parser.add_argument("out_dir")
+    parser.add_argument("--scale", type=int, default=1, help=f"Multiple of {BASE_ROWS:,} rows")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    paths, contractor_path = write_synthetic_exports(args.out_dir, args.scale, args.seed)
+    for path in paths + [contractor_path]:
+        print(f"[SUCCESS] {path}")
+
+
+if __name__ == "__main__":
+    main()